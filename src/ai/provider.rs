@@ -156,3 +156,27 @@ impl ProviderConfig {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use test_case::test_case;
+
+    #[test_case(AiProvider::Anthropic, "claude-3-haiku-20240307" ; "anthropic")]
+    #[test_case(AiProvider::OpenAi, "gpt-4o-mini" ; "openai")]
+    #[test_case(AiProvider::Google, "gemini-1.5-flash" ; "google")]
+    #[test_case(AiProvider::Ollama, "llama3.2" ; "ollama")]
+    fn test_default_model_per_provider(provider: AiProvider, model: &str) {
+        let config = ProviderConfig::new(provider);
+        assert_eq!(config.provider, provider);
+        assert_eq!(config.model, model);
+    }
+
+    #[test_case("Claude", AiProvider::Anthropic ; "claude")]
+    #[test_case("gpt", AiProvider::OpenAi ; "gpt")]
+    #[test_case("gemini", AiProvider::Google ; "gemini")]
+    #[test_case("local", AiProvider::Ollama ; "local")]
+    fn test_provider_aliases(name: &str, provider: AiProvider) {
+        assert_eq!(name.parse::<AiProvider>().unwrap(), provider);
+    }
+}
@@ -97,6 +97,52 @@ impl AiService {
 mod tests {
     use super::*;
     use crate::ai::AiProvider;
+    use std::sync::LazyLock;
+
+    /// ADR shared by the offline tests; built once rather than per test.
+    static SAMPLE_ADR: LazyLock<Adr> = LazyLock::new(|| {
+        let mut adr = Adr::new("ADR-0001".to_string(), "Use PostgreSQL".to_string());
+        adr.body = "## Context\n\nWe need a database.".to_string();
+        adr
+    });
+
+    /// Service with an explicit key, so no environment lookup or network
+    /// access is needed; the service is stateless, so tests share it.
+    static OFFLINE_SERVICE: LazyLock<AiService> = LazyLock::new(|| {
+        AiService::new(ProviderConfig::new(AiProvider::Anthropic).with_api_key("test-key"))
+    });
+
+    #[tokio::test]
+    async fn test_summarize_offline() {
+        let summary = OFFLINE_SERVICE
+            .summarize(&SAMPLE_ADR)
+            .await
+            .expect("Should summarize");
+        assert_eq!(summary, "ADR ADR-0001 proposes: Use PostgreSQL");
+    }
+
+    #[tokio::test]
+    async fn test_suggestions_offline() {
+        let service = &*OFFLINE_SERVICE;
+
+        let improvements = service
+            .suggest_improvements(&SAMPLE_ADR)
+            .await
+            .expect("Should suggest improvements");
+        assert!(!improvements.is_empty());
+
+        let status = service
+            .suggest_status(&SAMPLE_ADR)
+            .await
+            .expect("Should suggest status");
+        assert_eq!(status, "proposed");
+
+        let tags = service
+            .generate_tags(&SAMPLE_ADR)
+            .await
+            .expect("Should generate tags");
+        assert!(tags.contains(&"architecture".to_string()));
+    }
 
     #[tokio::test]
     #[ignore = "requires API key"]
@@ -1,6 +1,7 @@
 //! List artifacts attached to an ADR.
 
 use anyhow::Result;
+use base64::{engine::general_purpose::STANDARD as BASE64, Engine};
 use clap::Args as ClapArgs;
 use colored::Colorize;
 
@@ -63,8 +64,6 @@ pub fn run(args: Args) -> Result<()> {
                 );
             } else if let Some(extract_name) = &args.extract {
                 // Extract the artifact to a file
-                use base64::{engine::general_purpose::STANDARD as BASE64, Engine};
-
                 let encoded = artifact["content"]
                     .as_str()
                     .ok_or_else(|| anyhow::anyhow!("No content in artifact"))?;
@@ -66,13 +66,10 @@ pub fn run(args: Args) -> Result<()> {
         adr.id.cyan()
     );
 
-    // Read file content
+    // Read file content; its length is the file size, so no separate stat
     let content = std::fs::read(file_path)?;
     let encoded = BASE64.encode(&content);
-
-    // Get file metadata
-    let metadata = std::fs::metadata(file_path)?;
-    let size = metadata.len();
+    let size = content.len();
 
     // Create artifact metadata
     let artifact = serde_json::json!({
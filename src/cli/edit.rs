@@ -42,9 +42,13 @@ pub struct Args {
 /// # Errors
 ///
 /// Returns an error if editing fails.
-#[allow(clippy::useless_let_if_seq)]
 pub fn run(args: Args) -> Result<()> {
-    let git = Git::new();
+    run_edit(args, Git::new())
+}
+
+/// Edit an ADR in the repository at `git`.
+#[allow(clippy::useless_let_if_seq)]
+fn run_edit(args: Args, git: Git) -> Result<()> {
     git.check_repository()?;
 
     let config = ConfigManager::new(git.clone()).load()?;
@@ -127,3 +131,69 @@ pub fn run(args: Args) -> Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::core::{Adr, AdrConfig};
+    use crate::test_support::initialized_repo;
+    use tempfile::TempDir;
+
+    // Editing only rewrites a note, so the handler is called in-process
+    // instead of spawning the binary; tests/cli_edit.rs covers parsing.
+
+    fn setup_git_repo_with_adr() -> TempDir {
+        let temp_dir = initialized_repo();
+        let git = Git::with_work_dir(temp_dir.path());
+        let adr = Adr::new("ADR-0001".to_string(), "Use PostgreSQL".to_string());
+        NotesManager::new(git, AdrConfig::default())
+            .create(&adr)
+            .expect("Should create ADR");
+
+        temp_dir
+    }
+
+    fn edit_args(adr_id: &str) -> Args {
+        Args {
+            adr_id: adr_id.to_string(),
+            status: None,
+            add_tag: None,
+            remove_tag: None,
+            title: None,
+            add_decider: None,
+            remove_decider: None,
+        }
+    }
+
+    #[test]
+    fn test_run_edit_applies_changes() {
+        let temp_dir = setup_git_repo_with_adr();
+        let git = Git::with_work_dir(temp_dir.path());
+
+        let args = Args {
+            status: Some("accepted".to_string()),
+            add_tag: Some("database".to_string()),
+            title: Some("Use PostgreSQL 16".to_string()),
+            add_decider: Some("Alice".to_string()),
+            ..edit_args("ADR-0001")
+        };
+        run_edit(args, git.clone()).expect("Should edit ADR");
+
+        let adr = NotesManager::new(git, AdrConfig::default())
+            .get("ADR-0001")
+            .expect("Should get ADR");
+        assert_eq!(adr.frontmatter.status, AdrStatus::Accepted);
+        assert_eq!(adr.frontmatter.title, "Use PostgreSQL 16");
+        assert_eq!(adr.frontmatter.tags, vec!["database".to_string()]);
+        assert_eq!(adr.frontmatter.deciders, vec!["Alice".to_string()]);
+    }
+
+    #[test]
+    fn test_run_edit_not_found() {
+        let temp_dir = setup_git_repo_with_adr();
+        let git = Git::with_work_dir(temp_dir.path());
+
+        let result = run_edit(edit_args("ADR-9999"), git);
+        assert!(result.is_err());
+    }
+}
@@ -3,10 +3,12 @@
 use anyhow::Result;
 use clap::Args as ClapArgs;
 use colored::Colorize;
+use serde::Serialize;
 use std::fmt::Write;
 use std::fs;
 use std::path::Path;
 
+use crate::cli::AdrJson;
 use crate::core::{AdrStatus, ConfigManager, Git, NotesManager};
 
 /// Arguments for the export command.
@@ -38,9 +40,13 @@ pub struct Args {
 /// # Errors
 ///
 /// Returns an error if export fails.
-#[allow(clippy::too_many_lines)]
 pub fn run(args: Args) -> Result<()> {
-    let git = Git::new();
+    run_export(args, Git::new())
+}
+
+/// Export ADRs of the repository at `git`.
+#[allow(clippy::too_many_lines)]
+fn run_export(args: Args, git: Git) -> Result<()> {
     git.check_repository()?;
 
     let config = ConfigManager::new(git.clone()).load()?;
@@ -90,18 +96,7 @@ pub fn run(args: Args) -> Result<()> {
         let filepath = output_path.join(&filename);
 
         let content = if args.format == "json" {
-            let json = serde_json::json!({
-                "id": adr.id,
-                "title": adr.frontmatter.title,
-                "status": adr.frontmatter.status.to_string(),
-                "date": adr.frontmatter.date.as_ref().map(|d| d.datetime().to_rfc3339()),
-                "tags": adr.frontmatter.tags,
-                "authors": adr.frontmatter.authors,
-                "deciders": adr.frontmatter.deciders,
-                "commit": adr.commit,
-                "body": adr.body,
-            });
-            serde_json::to_string_pretty(&json)?
+            serde_json::to_string_pretty(&AdrJson::full(adr))?
         } else if args.format == "html" {
             export_html_single(adr)?
         } else {
@@ -139,6 +134,32 @@ pub fn run(args: Args) -> Result<()> {
     Ok(())
 }
 
+/// JSON representation of an ADR in the export index.
+#[derive(Serialize)]
+struct AdrIndexJson<'a> {
+    date: Option<String>,
+    id: &'a str,
+    status: String,
+    tags: &'a [String],
+    title: &'a str,
+}
+
+impl<'a> AdrIndexJson<'a> {
+    fn from_adr(adr: &'a crate::core::Adr) -> Self {
+        Self {
+            date: adr
+                .frontmatter
+                .date
+                .as_ref()
+                .map(|d| d.datetime().to_rfc3339()),
+            id: &adr.id,
+            status: adr.frontmatter.status.to_string(),
+            tags: &adr.frontmatter.tags,
+            title: &adr.frontmatter.title,
+        }
+    }
+}
+
 /// Export a single ADR to HTML.
 fn export_html_single(adr: &crate::core::Adr) -> Result<String> {
     let tags_html = if adr.frontmatter.tags.is_empty() {
@@ -192,18 +213,7 @@ fn export_html_single(adr: &crate::core::Adr) -> Result<String> {
 
 /// Export JSON index.
 fn export_json_index(adrs: &[crate::core::Adr]) -> Result<String> {
-    let index: Vec<_> = adrs
-        .iter()
-        .map(|adr| {
-            serde_json::json!({
-                "id": adr.id,
-                "title": adr.frontmatter.title,
-                "status": adr.frontmatter.status.to_string(),
-                "date": adr.frontmatter.date.as_ref().map(|d| d.datetime().to_rfc3339()),
-                "tags": adr.frontmatter.tags,
-            })
-        })
-        .collect();
+    let index: Vec<_> = adrs.iter().map(AdrIndexJson::from_adr).collect();
     Ok(serde_json::to_string_pretty(&index)?)
 }
 
@@ -325,3 +335,58 @@ fn markdown_to_html(md: &str) -> String {
 
     html
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::core::{Adr, AdrConfig};
+    use crate::test_support::initialized_repo;
+    use tempfile::TempDir;
+
+    // Called in-process so the filter logic is exercised without spawning
+    // the binary; tests/cli_export.rs covers the command line.
+
+    fn setup_git_repo_with_adrs() -> TempDir {
+        let temp_dir = initialized_repo();
+        let git = Git::with_work_dir(temp_dir.path());
+        let notes = NotesManager::new(git.clone(), AdrConfig::default());
+
+        // Each ADR is attached to its own commit
+        for (id, status) in [
+            ("ADR-0001", AdrStatus::Accepted),
+            ("ADR-0002", AdrStatus::Proposed),
+        ] {
+            git.run_silent(&["commit", "--allow-empty", "-m", id])
+                .expect("Should commit");
+            let mut adr = Adr::new(id.to_string(), format!("Decision {id}"));
+            adr.frontmatter.status = status;
+            notes.create(&adr).expect("Should create ADR");
+        }
+
+        temp_dir
+    }
+
+    #[test]
+    fn test_run_export_filter_by_status() {
+        let temp_dir = setup_git_repo_with_adrs();
+        let output = temp_dir.path().join("export");
+
+        let args = Args {
+            output: output.display().to_string(),
+            format: "json".to_string(),
+            status: Some("accepted".to_string()),
+            tag: None,
+            index: true,
+        };
+        run_export(args, Git::with_work_dir(temp_dir.path())).expect("Should export");
+
+        assert!(output.join("ADR-0001.json").exists());
+        assert!(!output.join("ADR-0002.json").exists());
+
+        let index = fs::read_to_string(output.join("index.json")).expect("Should read index");
+        let index: Vec<serde_json::Value> = serde_json::from_str(&index).expect("Valid JSON");
+        assert_eq!(index.len(), 1);
+        assert_eq!(index[0]["id"], "ADR-0001");
+        assert_eq!(index[0]["status"], "accepted");
+    }
+}
@@ -33,7 +33,11 @@ pub struct Args {
 ///
 /// Returns an error if import fails.
 pub fn run(args: Args) -> Result<()> {
-    let git = Git::new();
+    run_import(args, Git::new())
+}
+
+/// Import ADRs into the repository at `git`.
+fn run_import(args: Args, git: Git) -> Result<()> {
     git.check_repository()?;
 
     let config = ConfigManager::new(git.clone()).load()?;
@@ -334,3 +338,48 @@ fn extract_status_from_content(content: &str) -> Option<String> {
 
     None
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::core::AdrConfig;
+    use crate::test_support::initialized_repo;
+    use test_case::test_case;
+
+    // Called in-process so import runs without spawning the binary.
+
+    #[test_case("decision.json", "auto", "{}", "json" ; "json extension")]
+    #[test_case("0001-use-rust.md", "auto", "# Use Rust", "adr-tools" ; "numbered file")]
+    #[test_case("decision.md", "auto", "---\ntitle: x\n---", "markdown" ; "frontmatter")]
+    #[test_case("decision.json", "markdown", "{}", "markdown" ; "explicit format")]
+    fn test_detect_format(file: &str, hint: &str, content: &str, expected: &str) {
+        assert_eq!(detect_format(Path::new(file), hint, content), expected);
+    }
+
+    #[test]
+    fn test_run_import_dry_run_then_import() {
+        let temp_dir = initialized_repo();
+        let file = temp_dir.path().join("decision.json");
+        fs::write(
+            &file,
+            r#"{"id": "ADR-0007", "title": "Use JSON", "status": "accepted"}"#,
+        )
+        .expect("Failed to write file");
+        let args = |dry_run| Args {
+            path: file.display().to_string(),
+            format: "auto".to_string(),
+            link_by_date: false,
+            dry_run,
+        };
+        let git = Git::with_work_dir(temp_dir.path());
+        let notes = || NotesManager::new(git.clone(), AdrConfig::default());
+
+        run_import(args(true), git.clone()).expect("Should dry run");
+        assert!(notes().list().expect("Should list ADRs").is_empty());
+
+        run_import(args(false), git.clone()).expect("Should import");
+        let adr = notes().get("ADR-0007").expect("Should get ADR");
+        assert_eq!(adr.frontmatter.title, "Use JSON");
+        assert_eq!(adr.frontmatter.status, AdrStatus::Accepted);
+    }
+}
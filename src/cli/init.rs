@@ -36,8 +36,11 @@ pub struct Args {
 ///
 /// Returns an error if initialization fails.
 pub fn run(args: Args) -> Result<()> {
-    let git = Git::new();
+    run_init(args, Git::new())
+}
 
+/// Initialize git-adr in the repository at `git`.
+fn run_init(args: Args, git: Git) -> Result<()> {
     // Verify we're in a git repository
     git.check_repository()?;
 
@@ -80,3 +83,43 @@ pub fn run(args: Args) -> Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::process::Command as StdCommand;
+    use tempfile::TempDir;
+
+    fn init_args(prefix: &str, force: bool) -> Args {
+        Args {
+            namespace: "adr".to_string(),
+            template: "madr".to_string(),
+            prefix: prefix.to_string(),
+            digits: 4,
+            force,
+        }
+    }
+
+    #[test]
+    fn test_run_init_force_reinitialize() {
+        let temp_dir = TempDir::new().expect("Failed to create temp directory");
+        StdCommand::new("git")
+            .args(["init"])
+            .current_dir(temp_dir.path())
+            .output()
+            .expect("Failed to init git repo");
+        let git = Git::with_work_dir(temp_dir.path());
+
+        run_init(init_args("ADR-", false), git.clone()).expect("Should initialize");
+
+        // Without --force an existing setup is left alone
+        run_init(init_args("DEC-", false), git.clone()).expect("Should succeed");
+        let config = ConfigManager::new(git.clone()).load().expect("Should load");
+        assert_eq!(config.prefix, "ADR-");
+
+        run_init(init_args("DEC-", true), git.clone()).expect("Should reinitialize");
+        let config = ConfigManager::new(git).load().expect("Should load");
+        assert_eq!(config.prefix, "DEC-");
+        assert_eq!(config.format, "madr");
+    }
+}
@@ -5,6 +5,7 @@ use chrono::{DateTime, NaiveDate, Utc};
 use clap::Args as ClapArgs;
 use colored::Colorize;
 
+use crate::cli::AdrJson;
 use crate::core::{Adr, AdrStatus, ConfigManager, Git, NotesManager};
 
 /// Arguments for the list command.
@@ -181,19 +182,7 @@ fn print_table(adrs: &[Adr]) {
 
 /// Print ADRs as JSON.
 fn print_json(adrs: &[Adr]) -> Result<()> {
-    let output: Vec<serde_json::Value> = adrs
-        .iter()
-        .map(|adr| {
-            serde_json::json!({
-                "id": adr.id,
-                "title": adr.title(),
-                "status": adr.status().to_string(),
-                "date": adr.frontmatter.date.as_ref().map(|d| d.datetime().to_rfc3339()),
-                "tags": adr.frontmatter.tags,
-                "commit": adr.commit,
-            })
-        })
-        .collect();
+    let output: Vec<_> = adrs.iter().map(AdrJson::summary).collect();
 
     println!("{}", serde_json::to_string_pretty(&output)?);
     Ok(())
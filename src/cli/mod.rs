@@ -3,6 +3,9 @@
 //! This module defines the command-line interface using clap derive macros.
 
 use clap::{Parser, Subcommand};
+use serde::Serialize;
+
+use crate::core::Adr;
 
 pub mod artifacts;
 pub mod attach;
@@ -136,3 +139,138 @@ pub enum Commands {
     #[cfg(feature = "wiki")]
     Wiki(wiki::Args),
 }
+
+/// JSON representation of an ADR, as printed by `list`, `show` and `export`.
+///
+/// Keys are serialized in alphabetical order. Parts a command leaves out
+/// are omitted rather than written as `null`.
+#[derive(Serialize)]
+struct AdrJson<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    authors: Option<&'a [String]>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    body: Option<&'a str>,
+    commit: &'a str,
+    date: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    deciders: Option<&'a [String]>,
+    id: &'a str,
+    status: String,
+    tags: &'a [String],
+    title: &'a str,
+}
+
+impl<'a> AdrJson<'a> {
+    /// ID, title, status, date, tags and commit.
+    fn summary(adr: &'a Adr) -> Self {
+        Self {
+            authors: None,
+            body: None,
+            commit: &adr.commit,
+            date: adr
+                .frontmatter
+                .date
+                .as_ref()
+                .map(|d| d.datetime().to_rfc3339()),
+            deciders: None,
+            id: &adr.id,
+            status: adr.status().to_string(),
+            tags: &adr.frontmatter.tags,
+            title: adr.title(),
+        }
+    }
+
+    /// The summary plus authors and deciders.
+    fn metadata(adr: &'a Adr) -> Self {
+        Self {
+            authors: Some(&adr.frontmatter.authors),
+            deciders: Some(&adr.frontmatter.deciders),
+            ..Self::summary(adr)
+        }
+    }
+
+    /// All metadata plus the body.
+    fn full(adr: &'a Adr) -> Self {
+        Self {
+            body: Some(&adr.body),
+            ..Self::metadata(adr)
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use clap::CommandFactory;
+    use std::collections::HashMap;
+    use std::sync::OnceLock;
+
+    #[test]
+    fn test_cli_definition() {
+        Cli::command().debug_assert();
+    }
+
+    /// Help text for every subcommand, rendered once and shared by the
+    /// tests that check it.
+    fn subcommand_help() -> &'static HashMap<String, String> {
+        static HELP: OnceLock<HashMap<String, String>> = OnceLock::new();
+        HELP.get_or_init(|| {
+            // Render from the clap definition in-process instead of
+            // launching the binary with `--help` once per subcommand.
+            let mut cli = Cli::command();
+            cli.build();
+            cli.get_subcommands_mut()
+                .map(|sub| (sub.get_name().to_string(), sub.render_help().to_string()))
+                .collect()
+        })
+    }
+
+    #[test]
+    fn test_subcommand_help() {
+        for (name, help) in subcommand_help() {
+            assert!(
+                help.contains("Usage:"),
+                "help for `{name}` has no usage line:\n{help}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_adr_json_keys_sorted() {
+        let mut adr = Adr::new("ADR-0001".to_string(), "Use Rust".to_string());
+        adr.commit = "abc123".to_string();
+        let json = serde_json::to_string(&AdrJson::full(&adr)).unwrap();
+
+        // Keys must stay in the order `serde_json::json!` maps produce
+        let keys = [
+            "authors", "body", "commit", "date", "deciders", "id", "status", "tags", "title",
+        ];
+        let positions: Vec<usize> = keys
+            .iter()
+            .map(|key| json.find(&format!("\"{key}\":")).unwrap())
+            .collect();
+        assert!(positions.is_sorted(), "{json}");
+    }
+
+    #[test]
+    fn test_adr_json_summary_omits_details() {
+        let adr = Adr::new("ADR-0001".to_string(), "Use Rust".to_string());
+        let json = serde_json::to_string(&AdrJson::summary(&adr)).unwrap();
+        assert!(!json.contains("\"body\""), "{json}");
+        assert!(!json.contains("\"authors\""), "{json}");
+        assert!(json.contains("\"title\":\"Use Rust\""), "{json}");
+    }
+
+    #[test]
+    fn test_new_help_lists_options() {
+        let help = &subcommand_help()["new"];
+        assert!(help.contains("--template"), "{help}");
+        assert!(help.contains("--file"), "{help}");
+    }
+
+    #[test]
+    fn test_init_help_lists_options() {
+        let help = &subcommand_help()["init"];
+        assert!(help.contains("--namespace"), "{help}");
+    }
+}
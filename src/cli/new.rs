@@ -6,6 +6,7 @@ use clap::Args as ClapArgs;
 use colored::Colorize;
 
 use crate::core::{Adr, AdrStatus, ConfigManager, FlexibleDate, Git, NotesManager, TemplateEngine};
+use crate::Error;
 
 /// Arguments for the new command.
 #[derive(ClapArgs, Debug)]
@@ -72,8 +73,16 @@ pub fn run(args: Args) -> Result<()> {
     // Parse status
     let status: AdrStatus = args.status.parse().map_err(|e| anyhow::anyhow!("{}", e))?;
 
-    // Determine template format
+    // Determine template format; it is recorded even when --file supplies
+    // the body, so it must name a real template either way
     let format = args.template.as_deref().unwrap_or(&config.format);
+    let template_engine = TemplateEngine::new();
+    if !template_engine.has_template(format) {
+        return Err(Error::TemplateNotFound {
+            name: format.to_string(),
+        }
+        .into());
+    }
 
     // Get commit to attach to
     let commit = match &args.link {
@@ -90,16 +99,8 @@ pub fn run(args: Args) -> Result<()> {
     adr.frontmatter.date = Some(FlexibleDate(Utc::now()));
     adr.frontmatter.format = Some(format.to_string());
 
-    // Render template for body
-    let template_engine = TemplateEngine::new();
-    let mut context = std::collections::HashMap::new();
-    context.insert("title".to_string(), adr.frontmatter.title.clone());
-    context.insert("status".to_string(), adr.frontmatter.status.to_string());
-    let body = template_engine.render(format, &context)?;
-    adr.body = body;
-
-    // Read content from file if provided
     if let Some(file_path) = &args.file {
+        // Read content from file; it replaces the template body entirely
         let file_content = std::fs::read_to_string(file_path)?;
         // If file has frontmatter, parse it; otherwise use as body
         if file_content.trim().starts_with("---") {
@@ -109,6 +110,12 @@ pub fn run(args: Args) -> Result<()> {
         } else {
             adr.body = file_content;
         }
+    } else {
+        // Render template for body
+        let mut context = std::collections::HashMap::new();
+        context.insert("title".to_string(), adr.frontmatter.title.clone());
+        context.insert("status".to_string(), adr.frontmatter.status.to_string());
+        adr.body = template_engine.render(format, &context)?;
     }
 
     // Preview mode
@@ -92,6 +92,14 @@ pub fn run(args: Args) -> Result<()> {
 
     for adr in &adrs {
         let content = adr.to_markdown().unwrap_or_default();
+
+        // A plain-text query can't span lines or use anchors, so a single
+        // scan of the whole document rules out non-matching ADRs before
+        // any per-line work.
+        if !args.regex && !pattern.is_match(&content) {
+            continue;
+        }
+
         let lines: Vec<&str> = content.lines().collect();
         let mut matches = Vec::new();
 
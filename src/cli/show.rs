@@ -4,6 +4,7 @@ use anyhow::Result;
 use clap::Args as ClapArgs;
 use colored::Colorize;
 
+use crate::cli::AdrJson;
 use crate::core::{ConfigManager, Git, NotesManager};
 
 /// Arguments for the show command.
@@ -43,28 +44,9 @@ pub fn run(args: Args) -> Result<()> {
     match args.format.as_str() {
         "json" => {
             let output = if args.metadata_only {
-                serde_json::json!({
-                    "id": adr.id,
-                    "title": adr.frontmatter.title,
-                    "status": adr.frontmatter.status.to_string(),
-                    "date": adr.frontmatter.date.as_ref().map(|d| d.datetime().to_rfc3339()),
-                    "tags": adr.frontmatter.tags,
-                    "authors": adr.frontmatter.authors,
-                    "deciders": adr.frontmatter.deciders,
-                    "commit": adr.commit,
-                })
+                AdrJson::metadata(&adr)
             } else {
-                serde_json::json!({
-                    "id": adr.id,
-                    "title": adr.frontmatter.title,
-                    "status": adr.frontmatter.status.to_string(),
-                    "date": adr.frontmatter.date.as_ref().map(|d| d.datetime().to_rfc3339()),
-                    "tags": adr.frontmatter.tags,
-                    "authors": adr.frontmatter.authors,
-                    "deciders": adr.frontmatter.deciders,
-                    "commit": adr.commit,
-                    "body": adr.body,
-                })
+                AdrJson::full(&adr)
             };
             println!("{}", serde_json::to_string_pretty(&output)?);
         },
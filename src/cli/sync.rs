@@ -32,7 +32,11 @@ pub struct Args {
 ///
 /// Returns an error if sync fails.
 pub fn run(args: Args) -> Result<()> {
-    let git = Git::new();
+    run_sync(args, Git::new())
+}
+
+/// Sync ADRs of the repository at `git`.
+fn run_sync(args: Args, git: Git) -> Result<()> {
     git.check_repository()?;
 
     let config = ConfigManager::new(git.clone()).load()?;
@@ -79,3 +83,25 @@ pub fn run(args: Args) -> Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::test_support::initialized_repo;
+
+    #[test]
+    fn test_run_sync_no_remote() {
+        let temp_dir = initialized_repo();
+        let git = Git::with_work_dir(temp_dir.path());
+
+        // Called in-process: init and sync share one repository handle
+        // instead of two binary launches.
+        let args = Args {
+            remote: "origin".to_string(),
+            pull: false,
+            push: false,
+            force: false,
+        };
+        assert!(run_sync(args, git).is_err());
+    }
+}
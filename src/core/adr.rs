@@ -296,7 +296,9 @@ impl Adr {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use chrono::Datelike;
+    use chrono::{Datelike, TimeZone};
+    use std::collections::HashSet;
+    use test_case::test_case;
 
     #[test]
     fn test_status_display() {
@@ -404,20 +406,10 @@ accepted
         assert_eq!(*adr.status(), AdrStatus::Accepted);
     }
 
-    #[test]
-    fn test_adr_from_markdown_no_frontmatter() {
-        let content = "No frontmatter here";
-        let result = Adr::from_markdown("ADR-0001".to_string(), "abc123".to_string(), content);
-        assert!(result.is_err());
-    }
-
-    #[test]
-    fn test_adr_from_markdown_unclosed_frontmatter() {
-        let content = r#"---
-title: Unclosed
-status: proposed
-No closing marker
-"#;
+    #[test_case("No frontmatter here" ; "no frontmatter")]
+    #[test_case("---\ntitle: Unclosed\nstatus: proposed\nNo closing marker\n" ; "unclosed frontmatter")]
+    #[test_case("---\ntitle: [invalid yaml\nstatus: proposed\n---\n\nBody\n" ; "invalid yaml")]
+    fn test_adr_from_markdown_invalid(content: &str) {
         let result = Adr::from_markdown("ADR-0001".to_string(), "abc123".to_string(), content);
         assert!(result.is_err());
     }
@@ -474,25 +466,15 @@ No closing marker
 
     #[test]
     fn test_flexible_date_serialize() {
-        use chrono::TimeZone;
         let date = chrono::Utc.with_ymd_and_hms(2025, 12, 15, 0, 0, 0).unwrap();
         let flexible = FlexibleDate(date);
         let serialized = serde_yaml::to_string(&flexible).unwrap();
         assert!(serialized.contains("2025-12-15"));
     }
 
-    #[test]
-    fn test_flexible_date_deserialize_rfc3339() {
-        let yaml = "2025-12-15T00:00:00Z";
-        let result: FlexibleDate = serde_yaml::from_str(yaml).unwrap();
-        assert_eq!(result.0.year(), 2025);
-        assert_eq!(result.0.month(), 12);
-        assert_eq!(result.0.day(), 15);
-    }
-
-    #[test]
-    fn test_flexible_date_deserialize_date_only() {
-        let yaml = "2025-12-15";
+    #[test_case("2025-12-15T00:00:00Z" ; "rfc3339")]
+    #[test_case("2025-12-15" ; "date only")]
+    fn test_flexible_date_deserialize(yaml: &str) {
         let result: FlexibleDate = serde_yaml::from_str(yaml).unwrap();
         assert_eq!(result.0.year(), 2025);
         assert_eq!(result.0.month(), 12);
@@ -506,19 +488,6 @@ No closing marker
         assert!(result.is_err());
     }
 
-    #[test]
-    fn test_adr_from_markdown_invalid_yaml() {
-        let content = r#"---
-title: [invalid yaml
-status: proposed
----
-
-Body
-"#;
-        let result = Adr::from_markdown("ADR-0001".to_string(), "abc123".to_string(), content);
-        assert!(result.is_err());
-    }
-
     #[test]
     fn test_adr_frontmatter_with_all_fields() {
         let content = r#"---
@@ -557,7 +526,6 @@ Body content
 
     #[test]
     fn test_status_hash() {
-        use std::collections::HashSet;
         let mut set = HashSet::new();
         set.insert(AdrStatus::Proposed);
         set.insert(AdrStatus::Accepted);
@@ -2,6 +2,8 @@
 //!
 //! This module handles loading and saving configuration from git config.
 
+use std::collections::HashMap;
+
 use crate::core::Git;
 use crate::Error;
 
@@ -53,33 +55,22 @@ impl ConfigManager {
     pub fn load(&self) -> Result<AdrConfig, Error> {
         let mut config = AdrConfig::default();
 
-        // Check if initialized
-        if let Some(val) = self.git.config_get("adr.initialized")? {
-            config.initialized = val == "true";
-        }
-
-        // Load prefix
-        if let Some(val) = self.git.config_get("adr.prefix")? {
-            config.prefix = val;
-        }
-
-        // Load digits
-        if let Some(val) = self.git.config_get("adr.digits")? {
-            if let Ok(digits) = val.parse::<u8>() {
-                config.digits = digits;
+        // Every adr.* key comes from one cached git config read
+        for (key, val) in self.git.config_entries("adr.")? {
+            match key.as_str() {
+                "adr.initialized" => config.initialized = val == "true",
+                "adr.prefix" => config.prefix = val,
+                "adr.digits" => {
+                    if let Ok(digits) = val.parse::<u8>() {
+                        config.digits = digits;
+                    }
+                },
+                "adr.template" => config.template = val,
+                "adr.format" => config.format = val,
+                _ => {},
             }
         }
 
-        // Load template
-        if let Some(val) = self.git.config_get("adr.template")? {
-            config.template = val;
-        }
-
-        // Load format
-        if let Some(val) = self.git.config_get("adr.format")? {
-            config.format = val;
-        }
-
         Ok(config)
     }
 
@@ -89,15 +80,13 @@ impl ConfigManager {
     ///
     /// Returns an error if configuration cannot be saved.
     pub fn save(&self, config: &AdrConfig) -> Result<(), Error> {
-        self.git
-            .config_set("adr.initialized", &config.initialized.to_string())?;
-        self.git.config_set("adr.prefix", &config.prefix)?;
-        self.git
-            .config_set("adr.digits", &config.digits.to_string())?;
-        self.git.config_set("adr.template", &config.template)?;
-        self.git.config_set("adr.format", &config.format)?;
-
-        Ok(())
+        self.set_many(&[
+            ("initialized", &config.initialized.to_string()),
+            ("prefix", &config.prefix),
+            ("digits", &config.digits.to_string()),
+            ("template", &config.template),
+            ("format", &config.format),
+        ])
     }
 
     /// Initialize ADR in the repository.
@@ -144,6 +133,31 @@ impl ConfigManager {
     pub fn set(&self, key: &str, value: &str) -> Result<(), Error> {
         self.git.config_set(&format!("adr.{key}"), value)
     }
+
+    /// Set several config values at once.
+    ///
+    /// The repository's current `adr.*` values are read with a single git
+    /// call and only keys whose value actually changes are written.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if a value cannot be set.
+    pub fn set_many(&self, pairs: &[(&str, &str)]) -> Result<(), Error> {
+        let current: HashMap<String, String> = self
+            .git
+            .config_get_regexp(r"^adr\.", true)?
+            .into_iter()
+            .collect();
+
+        for &(key, value) in pairs {
+            let key = format!("adr.{key}");
+            if current.get(&key).map(String::as_str) != Some(value) {
+                self.git.config_set(&key, value)?;
+            }
+        }
+
+        Ok(())
+    }
 }
 
 #[cfg(test)]
@@ -309,4 +323,40 @@ mod tests {
         let result = manager.get("nonexistent").expect("Should get");
         assert_eq!(result, None);
     }
+
+    #[test]
+    fn test_config_set_many() {
+        let temp_dir = setup_git_repo();
+        let git = Git::with_work_dir(temp_dir.path());
+        let manager = ConfigManager::new(git);
+
+        manager
+            .set_many(&[("prefix", "DEC-"), ("digits", "3")])
+            .expect("Should set");
+        // Re-applying identical values is a no-op
+        manager
+            .set_many(&[("prefix", "DEC-"), ("format", "madr")])
+            .expect("Should set");
+
+        let config = manager.load().expect("Should load config");
+        assert_eq!(config.prefix, "DEC-");
+        assert_eq!(config.digits, 3);
+        assert_eq!(config.format, "madr");
+    }
+
+    #[test]
+    fn test_config_load_sees_writes_through_other_handles() {
+        let temp_dir = setup_git_repo();
+        let manager = ConfigManager::new(Git::with_work_dir(temp_dir.path()));
+
+        let config = manager.load().expect("Should load config");
+        assert_eq!(config.prefix, "ADR-");
+
+        // A write through a separate Git handle is seen by the next load
+        Git::with_work_dir(temp_dir.path())
+            .config_set("adr.prefix", "DEC-")
+            .expect("Should set");
+        let config = manager.load().expect("Should load config");
+        assert_eq!(config.prefix, "DEC-");
+    }
 }
@@ -3,11 +3,146 @@
 //! This module provides a wrapper around git subprocess calls,
 //! handling command execution, error parsing, and output processing.
 
+use std::collections::HashMap;
+use std::ffi::OsStr;
+use std::io::Write;
 use std::path::{Path, PathBuf};
-use std::process::{Command, Output};
+use std::process::{Command, Output, Stdio};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex, MutexGuard, OnceLock, PoisonError};
+use std::time::SystemTime;
 
 use crate::Error;
 
+/// Normalize a config key the way `git config --list` prints it.
+///
+/// Section and variable names are case-insensitive and listed in
+/// lowercase; a subsection keeps its case.
+fn canonical_config_key(key: &str) -> String {
+    match (key.find('.'), key.rfind('.')) {
+        (Some(first), Some(last)) => format!(
+            "{}{}{}",
+            key[..first].to_lowercase(),
+            &key[first..last],
+            key[last..].to_lowercase()
+        ),
+        _ => key.to_lowercase(),
+    }
+}
+
+/// Modification time and size of a config file, or `None` if it is missing.
+type FileStamp = Option<(SystemTime, u64)>;
+
+/// Stamp a config file so later changes to it can be noticed.
+fn file_stamp(path: &Path) -> FileStamp {
+    let meta = std::fs::metadata(path).ok()?;
+    Some((meta.modified().ok()?, meta.len()))
+}
+
+/// Entries from one `git config --list` read, and the files behind them.
+#[derive(Debug)]
+struct ConfigCache {
+    /// Entries keyed by canonical name.
+    entries: HashMap<String, String>,
+    /// Every config file git could have read, stamped at read time. Files
+    /// that were missing are included, so creating one is noticed too.
+    sources: Vec<(PathBuf, FileStamp)>,
+}
+
+impl ConfigCache {
+    /// Whether a config file has changed since the entries were read.
+    fn is_stale(&self) -> bool {
+        self.sources
+            .iter()
+            .any(|(path, stamp)| file_stamp(path) != *stamp)
+    }
+}
+
+/// Record a config file among a cache's sources, unless it is already there.
+fn add_source(sources: &mut Vec<(PathBuf, FileStamp)>, path: PathBuf) {
+    if !sources.iter().any(|(known, _)| *known == path) {
+        let stamp = file_stamp(&path);
+        sources.push((path, stamp));
+    }
+}
+
+/// Whether a config key names a file to include.
+fn is_include_key(key: &str) -> bool {
+    key == "include.path" || (key.starts_with("includeif.") && key.ends_with(".path"))
+}
+
+/// The user's home directory, as git finds it.
+fn home_dir() -> Option<PathBuf> {
+    std::env::var_os("HOME")
+        .filter(|home| !home.is_empty())
+        .map(PathBuf::from)
+}
+
+/// System and global config files git reads, whether or not they exist.
+fn user_config_files() -> Vec<PathBuf> {
+    let mut files = Vec::new();
+    if std::env::var_os("GIT_CONFIG_NOSYSTEM").is_none() {
+        files.push(
+            std::env::var_os("GIT_CONFIG_SYSTEM")
+                .map_or_else(|| PathBuf::from("/etc/gitconfig"), PathBuf::from),
+        );
+    }
+    if let Some(global) = std::env::var_os("GIT_CONFIG_GLOBAL") {
+        files.push(PathBuf::from(global));
+    } else {
+        let xdg = std::env::var_os("XDG_CONFIG_HOME")
+            .filter(|dir| !dir.is_empty())
+            .map(PathBuf::from)
+            .or_else(|| home_dir().map(|home| home.join(".config")));
+        files.extend(xdg.map(|dir| dir.join("git").join("config")));
+        files.extend(home_dir().map(|home| home.join(".gitconfig")));
+    }
+    files
+}
+
+/// Locate the git executable on `PATH`.
+///
+/// The search runs once per process; every `Git` instance reuses the result
+/// so spawning git doesn't walk `PATH` each time. Falls back to plain `git`
+/// if nothing is found, leaving the spawn to report `GitNotFound`.
+fn git_executable() -> &'static Path {
+    static GIT_PATH: OnceLock<PathBuf> = OnceLock::new();
+    GIT_PATH.get_or_init(|| {
+        std::env::var_os("PATH")
+            .and_then(|paths| find_git(&paths))
+            .unwrap_or_else(|| PathBuf::from("git"))
+    })
+}
+
+/// Find the first git executable in a `PATH`-style list of directories.
+fn find_git(paths: &OsStr) -> Option<PathBuf> {
+    let name = format!("git{}", std::env::consts::EXE_SUFFIX);
+    // Relative entries would resolve against each command's working
+    // directory, so only absolute ones are considered
+    std::env::split_paths(paths)
+        .filter(|dir| dir.is_absolute())
+        .map(|dir| dir.join(&name))
+        .find(|candidate| is_executable(candidate))
+}
+
+/// Whether `path` is a file that can be executed.
+///
+/// A `git` without execute permission is skipped, as the OS would skip it,
+/// rather than cached and failing every spawn.
+#[cfg(unix)]
+fn is_executable(path: &Path) -> bool {
+    use std::os::unix::fs::PermissionsExt;
+
+    path.metadata()
+        .is_ok_and(|meta| meta.is_file() && meta.permissions().mode() & 0o111 != 0)
+}
+
+/// Whether `path` is a file that can be executed.
+#[cfg(not(unix))]
+fn is_executable(path: &Path) -> bool {
+    path.is_file()
+}
+
 /// Git subprocess wrapper.
 #[derive(Debug, Clone)]
 pub struct Git {
@@ -15,6 +150,11 @@ pub struct Git {
     work_dir: PathBuf,
     /// Path to git executable.
     git_path: PathBuf,
+    /// Whether `check_repository` has already succeeded, shared by every
+    /// clone.
+    repository_checked: Arc<AtomicBool>,
+    /// Cached `git config --list` entries, shared by every clone.
+    config_cache: Arc<Mutex<Option<ConfigCache>>>,
 }
 
 impl Default for Git {
@@ -29,7 +169,9 @@ impl Git {
     pub fn new() -> Self {
         Self {
             work_dir: std::env::current_dir().unwrap_or_else(|_| PathBuf::from(".")),
-            git_path: PathBuf::from("git"),
+            git_path: git_executable().to_path_buf(),
+            repository_checked: Arc::default(),
+            config_cache: Arc::default(),
         }
     }
 
@@ -38,7 +180,9 @@ impl Git {
     pub fn with_work_dir<P: AsRef<Path>>(path: P) -> Self {
         Self {
             work_dir: path.as_ref().to_path_buf(),
-            git_path: PathBuf::from("git"),
+            git_path: git_executable().to_path_buf(),
+            repository_checked: Arc::default(),
+            config_cache: Arc::default(),
         }
     }
 
@@ -50,16 +194,31 @@ impl Git {
 
     /// Check if we're in a git repository.
     ///
+    /// A successful check is remembered, so later calls on this instance
+    /// and its clones don't spawn git again.
+    ///
     /// # Errors
     ///
     /// Returns an error if git is not found or we're not in a repository.
     pub fn check_repository(&self) -> Result<(), Error> {
-        let output = self.run(&["rev-parse", "--git-dir"])?;
-        if !output.status.success() {
+        if self.repository_checked.load(Ordering::Relaxed) {
+            return Ok(());
+        }
+
+        let args = ["rev-parse", "--git-dir"];
+        // Only the exit status matters, so neither stream is captured
+        let status = self
+            .command(&args)
+            .stdout(Stdio::null())
+            .stderr(Stdio::null())
+            .status()
+            .map_err(|e| Self::io_error(&e, &args))?;
+        if !status.success() {
             return Err(Error::NotARepository {
                 path: Some(self.work_dir.display().to_string()),
             });
         }
+        self.repository_checked.store(true, Ordering::Relaxed);
         Ok(())
     }
 
@@ -80,22 +239,79 @@ impl Git {
     ///
     /// Returns an error if the command fails to execute.
     pub fn run(&self, args: &[&str]) -> Result<Output, Error> {
-        Command::new(&self.git_path)
-            .current_dir(&self.work_dir)
+        Self::execute(&mut self.command(args), args)
+    }
+
+    /// Build a git command rooted at the working directory.
+    fn command(&self, args: &[&str]) -> Command {
+        // git is spawned directly from an argv list, never through a shell,
+        // and never reads the caller's terminal
+        let mut cmd = Command::new(&self.git_path);
+        cmd.current_dir(&self.work_dir)
             .args(args)
-            .output()
-            .map_err(|e| {
-                if e.kind() == std::io::ErrorKind::NotFound {
-                    Error::GitNotFound
-                } else {
-                    Error::Git {
-                        message: e.to_string(),
-                        command: args.iter().map(|s| (*s).to_string()).collect(),
-                        exit_code: -1,
-                        stderr: String::new(),
-                    }
-                }
-            })
+            .stdin(Stdio::null());
+        cmd
+    }
+
+    /// Execute a prepared git command, mapping spawn failures to `Error`.
+    fn execute(cmd: &mut Command, args: &[&str]) -> Result<Output, Error> {
+        cmd.output().map_err(|e| Self::io_error(&e, args))
+    }
+
+    /// Map an I/O error from running git to `Error`.
+    fn io_error(e: &std::io::Error, args: &[&str]) -> Error {
+        if e.kind() == std::io::ErrorKind::NotFound {
+            Error::GitNotFound
+        } else {
+            Error::Git {
+                message: e.to_string(),
+                command: args.iter().map(|s| (*s).to_string()).collect(),
+                exit_code: -1,
+                stderr: String::new(),
+            }
+        }
+    }
+
+    /// Build the error for a git command that exited unsuccessfully.
+    ///
+    /// Output is decoded as UTF-8, replacing invalid sequences, whatever the
+    /// current locale.
+    fn command_error(args: &[&str], output: &Output) -> Error {
+        Error::Git {
+            message: format!("git command failed: git {}", args.join(" ")),
+            command: args.iter().map(|s| (*s).to_string()).collect(),
+            exit_code: output.status.code().unwrap_or(-1),
+            stderr: String::from_utf8_lossy(&output.stderr).to_string(),
+        }
+    }
+
+    /// Run a git command feeding `input` on stdin, and return its output.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the command fails to execute.
+    fn run_with_input(&self, args: &[&str], input: Vec<u8>) -> Result<Output, Error> {
+        let mut child = self
+            .command(args)
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()
+            .map_err(|e| Self::io_error(&e, args))?;
+
+        // Write from another thread so a full stdout pipe can't deadlock us
+        let mut stdin = child.stdin.take().expect("stdin is piped");
+        let writer = std::thread::spawn(move || stdin.write_all(&input));
+
+        let output = child
+            .wait_with_output()
+            .map_err(|e| Self::io_error(&e, args))?;
+        writer
+            .join()
+            .expect("stdin writer panicked")
+            .map_err(|e| Self::io_error(&e, args))?;
+
+        Ok(output)
     }
 
     /// Run a git command and return stdout as a string.
@@ -107,13 +323,7 @@ impl Git {
         let output = self.run(args)?;
 
         if !output.status.success() {
-            let stderr = String::from_utf8_lossy(&output.stderr).to_string();
-            return Err(Error::Git {
-                message: format!("git command failed: git {}", args.join(" ")),
-                command: args.iter().map(|s| (*s).to_string()).collect(),
-                exit_code: output.status.code().unwrap_or(-1),
-                stderr,
-            });
+            return Err(Self::command_error(args, &output));
         }
 
         Ok(String::from_utf8_lossy(&output.stdout).to_string())
@@ -125,16 +335,12 @@ impl Git {
     ///
     /// Returns an error if the command fails.
     pub fn run_silent(&self, args: &[&str]) -> Result<(), Error> {
-        let output = self.run(args)?;
+        // stdout is never read, so discard it instead of buffering it;
+        // stderr is still captured for the error message.
+        let output = Self::execute(self.command(args).stdout(Stdio::null()), args)?;
 
         if !output.status.success() {
-            let stderr = String::from_utf8_lossy(&output.stderr).to_string();
-            return Err(Error::Git {
-                message: format!("git command failed: git {}", args.join(" ")),
-                command: args.iter().map(|s| (*s).to_string()).collect(),
-                exit_code: output.status.code().unwrap_or(-1),
-                stderr,
-            });
+            return Err(Self::command_error(args, &output));
         }
 
         Ok(())
@@ -162,19 +368,176 @@ impl Git {
 
     /// Get a git config value.
     ///
+    /// Values come from a single cached `git config --list` read; see
+    /// [`Git::config_entries`].
+    ///
     /// # Errors
     ///
-    /// Returns an error if the config key doesn't exist.
+    /// Returns an error if the config cannot be read.
     pub fn config_get(&self, key: &str) -> Result<Option<String>, Error> {
-        let output = self.run(&["config", "--get", key])?;
+        self.load_config()?;
+        let cache = self.config_cache();
+        Ok(cache
+            .as_ref()
+            .and_then(|cache| cache.entries.get(&canonical_config_key(key)))
+            .cloned())
+    }
+
+    /// Get all git config entries whose key starts with `prefix`.
+    ///
+    /// Every visible config entry is read with one `git config --list`
+    /// call. The result is shared by all clones of this instance and read
+    /// again after a value is set or unset through any of them, or when a
+    /// config file git reads is created, changed or removed on disk. Keys are canonical:
+    /// section and variable names are lowercase. Values are trimmed. For
+    /// multi-valued keys the last value wins, as with `git config --get`.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if git cannot be executed.
+    pub fn config_entries(&self, prefix: &str) -> Result<Vec<(String, String)>, Error> {
+        self.load_config()?;
+        let cache = self.config_cache();
+        Ok(cache
+            .iter()
+            .flat_map(|cache| &cache.entries)
+            .filter(|(key, _)| key.starts_with(prefix))
+            .map(|(key, value)| (key.clone(), value.clone()))
+            .collect())
+    }
+
+    /// Lock the config cache.
+    ///
+    /// The cache holds no invariant a panicking holder could break, so a
+    /// poisoned lock is used as is.
+    fn config_cache(&self) -> MutexGuard<'_, Option<ConfigCache>> {
+        self.config_cache
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+    }
+
+    /// Read `git config --list` into the cache unless a current copy is
+    /// already there.
+    fn load_config(&self) -> Result<(), Error> {
+        if self
+            .config_cache()
+            .as_ref()
+            .is_some_and(|cache| !cache.is_stale())
+        {
+            return Ok(());
+        }
+
+        let output = self.run(&["config", "--list", "--show-origin", "-z"])?;
+        let mut entries = HashMap::new();
+        let mut sources: Vec<(PathBuf, FileStamp)> = Vec::new();
+        for path in user_config_files() {
+            add_source(&mut sources, path);
+        }
+        // Outside a repository there is no local or worktree config
+        if let Ok(paths) = self.run_output(&[
+            "rev-parse",
+            "--git-path",
+            "config",
+            "--git-path",
+            "config.worktree",
+        ]) {
+            for path in paths.lines() {
+                add_source(&mut sources, self.work_dir.join(path));
+            }
+        }
 
         if output.status.success() {
-            Ok(Some(
-                String::from_utf8_lossy(&output.stdout).trim().to_string(),
-            ))
+            // Each entry is preceded by its origin. Both are NUL-terminated,
+            // and the key is separated from the value by a newline
+            // (valueless keys have no newline).
+            let stdout = String::from_utf8_lossy(&output.stdout);
+            let mut fields = stdout.split('\0');
+            while let (Some(origin), Some(entry)) = (fields.next(), fields.next()) {
+                let (key, value) = entry.split_once('\n').unwrap_or((entry, ""));
+                let value = value.trim();
+                entries.insert(key.to_string(), value.to_string());
+
+                if let Some(file) = origin.strip_prefix("file:") {
+                    let path = self.config_file_path(file);
+                    // An included file may not exist yet
+                    if is_include_key(key) {
+                        let include = Self::include_path(&path, value);
+                        add_source(&mut sources, include);
+                    }
+                    add_source(&mut sources, path);
+                }
+            }
+        }
+
+        *self.config_cache() = Some(ConfigCache { entries, sources });
+        Ok(())
+    }
+
+    /// Resolve an `include.path` value found in the config file `origin`.
+    ///
+    /// `~/` is the home directory; other relative paths are relative to
+    /// the directory of the including file.
+    fn include_path(origin: &Path, value: &str) -> PathBuf {
+        if let (Some(rest), Some(home)) = (value.strip_prefix("~/"), home_dir()) {
+            return home.join(rest);
+        }
+        origin
+            .parent()
+            .map_or_else(|| PathBuf::from(value), |dir| dir.join(value))
+    }
+
+    /// Resolve a config file path as printed by `git config --show-origin`.
+    ///
+    /// Relative paths are relative to the top of the working tree, which is
+    /// the nearest ancestor of the working directory that contains them.
+    fn config_file_path(&self, file: &str) -> PathBuf {
+        let file = Path::new(file);
+        if file.is_absolute() {
+            return file.to_path_buf();
+        }
+        self.work_dir
+            .ancestors()
+            .map(|dir| dir.join(file))
+            .find(|path| path.exists())
+            .unwrap_or_else(|| self.work_dir.join(file))
+    }
+
+    /// Get all git config entries whose key matches a regular expression.
+    ///
+    /// Reads every matching key with a single git invocation. If `local` is
+    /// true, only the repository's own config file is consulted.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if git cannot be executed.
+    pub fn config_get_regexp(
+        &self,
+        pattern: &str,
+        local: bool,
+    ) -> Result<Vec<(String, String)>, Error> {
+        let args: &[&str] = if local {
+            &["config", "--local", "-z", "--get-regexp", pattern]
         } else {
-            Ok(None)
+            &["config", "-z", "--get-regexp", pattern]
+        };
+
+        let output = self.run(args)?;
+        if !output.status.success() {
+            // Exit code 1 means no matching keys
+            return Ok(Vec::new());
         }
+
+        // With -z, entries are NUL-terminated and the key is separated from
+        // the value by a newline (valueless keys have no newline).
+        let stdout = String::from_utf8_lossy(&output.stdout);
+        Ok(stdout
+            .split('\0')
+            .filter(|entry| !entry.is_empty())
+            .map(|entry| match entry.split_once('\n') {
+                Some((key, value)) => (key.to_string(), value.to_string()),
+                None => (entry.to_string(), String::new()),
+            })
+            .collect())
     }
 
     /// Set a git config value.
@@ -183,6 +546,7 @@ impl Git {
     ///
     /// Returns an error if the config cannot be set.
     pub fn config_set(&self, key: &str, value: &str) -> Result<(), Error> {
+        self.config_cache().take();
         self.run_silent(&["config", key, value])
     }
 
@@ -194,13 +558,10 @@ impl Git {
     ///
     /// Returns an error if the config cannot be unset.
     pub fn config_unset(&self, key: &str, all: bool) -> Result<(), Error> {
-        let args: Vec<&str> = if all {
-            vec!["config", "--unset-all", key]
-        } else {
-            vec!["config", "--unset", key]
-        };
+        let args = ["config", if all { "--unset-all" } else { "--unset" }, key];
 
         // Ignore error if the key doesn't exist (exit code 5)
+        self.config_cache().take();
         let output = self.run(&args)?;
         if output.status.success() || output.status.code() == Some(5) {
             Ok(())
@@ -234,13 +595,21 @@ impl Git {
 
     /// Add or update notes for a commit.
     ///
+    /// The content is streamed on stdin rather than passed as an argument,
+    /// so large ADRs are neither copied into the argv nor limited by it.
+    ///
     /// # Errors
     ///
     /// Returns an error if the notes cannot be added.
     pub fn notes_add(&self, notes_ref: &str, commit: &str, content: &str) -> Result<(), Error> {
-        self.run_silent(&[
-            "notes", "--ref", notes_ref, "add", "-f", "-m", content, commit,
-        ])
+        let args = ["notes", "--ref", notes_ref, "add", "-f", "-F", "-", commit];
+        let output = self.run_with_input(&args, content.as_bytes().to_vec())?;
+
+        if !output.status.success() {
+            return Err(Self::command_error(&args, &output));
+        }
+
+        Ok(())
     }
 
     /// Remove notes for a commit.
@@ -265,19 +634,92 @@ impl Git {
             return Ok(Vec::new());
         }
 
+        // Each line is "<note blob> <annotated commit>"; parse in place
+        // rather than collecting every line's fields into a Vec first
         let stdout = String::from_utf8_lossy(&output.stdout);
-        let mut results = Vec::new();
+        Ok(stdout
+            .lines()
+            .filter_map(|line| {
+                let mut parts = line.split_whitespace();
+                Some((parts.next()?.to_string(), parts.next()?.to_string()))
+            })
+            .collect())
+    }
 
-        for line in stdout.lines() {
-            let parts: Vec<&str> = line.split_whitespace().collect();
-            if parts.len() >= 2 {
-                results.push((parts[0].to_string(), parts[1].to_string()));
-            }
+    /// Read the contents of several objects through one git process.
+    ///
+    /// `objects` may be any names `git cat-file` accepts (hashes, or
+    /// `<rev>:<path>`). Results are returned in the same order, with `None`
+    /// for objects that don't exist.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if git cannot be executed or fails.
+    pub fn cat_file_batch(&self, objects: &[&str]) -> Result<Vec<Option<Vec<u8>>>, Error> {
+        if objects.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        let mut input = Vec::with_capacity(objects.len() * 41);
+        for object in objects {
+            input.extend_from_slice(object.as_bytes());
+            input.push(b'\n');
+        }
+        let args = ["cat-file", "--batch", "--buffer"];
+        let output = self.run_with_input(&args, input)?;
+        if !output.status.success() {
+            return Err(Self::command_error(&args, &output));
+        }
+
+        // Each object is "<sha> <type> <size>\n<content>\n", or
+        // "<name> missing\n" if it doesn't exist.
+        let mut stdout = output.stdout.as_slice();
+        let mut results = Vec::with_capacity(objects.len());
+        while results.len() < objects.len() {
+            let Some(newline) = stdout.iter().position(|&b| b == b'\n') else {
+                break;
+            };
+            let header = String::from_utf8_lossy(&stdout[..newline]);
+            stdout = &stdout[newline + 1..];
+
+            let Some(size) = header
+                .rsplit(' ')
+                .next()
+                .and_then(|size| size.parse::<usize>().ok())
+            else {
+                results.push(None);
+                continue;
+            };
+            let size = size.min(stdout.len());
+            results.push(Some(stdout[..size].to_vec()));
+            stdout = stdout.get(size + 1..).unwrap_or_default();
         }
 
         Ok(results)
     }
 
+    /// Read every note in a ref.
+    ///
+    /// Returns `(commit, content)` pairs in `notes list` order, using two
+    /// git processes in total instead of one `notes show` per note.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the notes cannot be read.
+    pub fn notes_show_all(&self, notes_ref: &str) -> Result<Vec<(String, String)>, Error> {
+        let notes = self.notes_list(notes_ref)?;
+        let blobs: Vec<&str> = notes.iter().map(|(blob, _)| blob.as_str()).collect();
+        let contents = self.cat_file_batch(&blobs)?;
+
+        Ok(notes
+            .into_iter()
+            .zip(contents)
+            .filter_map(|((_, commit), content)| {
+                content.map(|bytes| (commit, String::from_utf8_lossy(&bytes).to_string()))
+            })
+            .collect())
+    }
+
     /// Push notes to a remote.
     ///
     /// # Errors
@@ -308,14 +750,87 @@ impl Git {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::sync::OnceLock;
     use tempfile::TempDir;
 
+    /// Repository with one commit and no notes, shared by the tests that
+    /// only read from it.
+    static READ_ONLY_REPO: OnceLock<TempDir> = OnceLock::new();
+
+    /// Get the shared read-only repository, creating it on first use.
+    fn read_only_repo() -> &'static Path {
+        READ_ONLY_REPO
+            .get_or_init(|| {
+                let temp_dir = TempDir::new().unwrap();
+                init_repo_with_commit(temp_dir.path());
+                temp_dir
+            })
+            .path()
+    }
+
+    /// Initialize a repository with one commit.
+    ///
+    /// The identity is passed with `-c` rather than written by separate
+    /// `git config` calls, so this takes two git processes.
+    fn init_repo_with_commit(path: &Path) {
+        Command::new("git")
+            .current_dir(path)
+            .args(["init"])
+            .output()
+            .unwrap();
+        let output = Command::new("git")
+            .current_dir(path)
+            .args([
+                "-c",
+                "user.email=test@example.com",
+                "-c",
+                "user.name=Test",
+                "commit",
+                "--allow-empty",
+                "-m",
+                "Initial",
+            ])
+            .output()
+            .unwrap();
+        assert!(output.status.success(), "{output:?}");
+    }
+
     #[test]
     fn test_git_new() {
         let git = Git::new();
         assert!(git.work_dir().exists() || git.work_dir() == Path::new("."));
     }
 
+    #[test]
+    fn test_git_executable_resolved_once() {
+        let path = git_executable();
+        assert!(
+            path.is_absolute(),
+            "git should be found on PATH: {}",
+            path.display()
+        );
+        assert!(std::ptr::eq(path, git_executable()));
+        assert_eq!(Git::new().git_path, path);
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn test_find_git_skips_non_executable() {
+        use std::os::unix::fs::PermissionsExt;
+
+        let temp_dir = TempDir::new().unwrap();
+        let (shadow, real) = (temp_dir.path().join("a"), temp_dir.path().join("b"));
+        for (dir, mode) in [(&shadow, 0o644), (&real, 0o755)] {
+            std::fs::create_dir(dir).unwrap();
+            let git = dir.join("git");
+            std::fs::write(&git, "").unwrap();
+            std::fs::set_permissions(&git, std::fs::Permissions::from_mode(mode)).unwrap();
+        }
+
+        let paths = std::env::join_paths([&shadow, &real]).unwrap();
+        assert_eq!(find_git(&paths), Some(real.join("git")));
+    }
+
     #[test]
     fn test_git_default() {
         let git = Git::default();
@@ -343,6 +858,23 @@ mod tests {
         assert!(result.is_err());
     }
 
+    #[test]
+    fn test_check_repository_remembers_success() {
+        let temp_dir = TempDir::new().unwrap();
+        let git = Git::with_work_dir(temp_dir.path());
+        assert!(git.check_repository().is_err());
+
+        // A failed check is not cached
+        Command::new("git")
+            .current_dir(temp_dir.path())
+            .args(["init"])
+            .output()
+            .unwrap();
+        assert!(git.check_repository().is_ok());
+        assert!(git.repository_checked.load(Ordering::Relaxed));
+        assert!(git.check_repository().is_ok());
+    }
+
     #[test]
     fn test_run_success() {
         let git = Git::new();
@@ -378,22 +910,54 @@ mod tests {
     }
 
     #[test]
-    fn test_notes_list_empty() {
+    fn test_run_silent_failure_keeps_stderr() {
         let temp_dir = TempDir::new().unwrap();
         let git = Git::with_work_dir(temp_dir.path());
-        // Initialize git repo but no notes
+        assert!(matches!(
+            git.run_silent(&["status"]),
+            Err(Error::Git { ref stderr, .. }) if !stderr.is_empty()
+        ));
+    }
+
+    #[test]
+    fn test_notes_list_empty() {
+        // Repository without any notes
+        let git = Git::with_work_dir(read_only_repo());
+        let result = git.notes_list("adr");
+        assert!(result.is_ok());
+        assert!(result.unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_notes_show_all() {
+        let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
             .args(["init"])
             .output()
             .unwrap();
-        let result = git.notes_list("adr");
-        assert!(result.is_ok());
-        assert!(result.unwrap().is_empty());
+        let git = Git::with_work_dir(temp_dir.path());
+        git.config_set("user.email", "test@example.com").unwrap();
+        git.config_set("user.name", "Test").unwrap();
+        assert!(git.notes_show_all("adr").unwrap().is_empty());
+
+        let mut expected = Vec::new();
+        for (message, note) in [("First", "one\n\nline"), ("Second", "two\n")] {
+            git.run_silent(&["commit", "--allow-empty", "-m", message])
+                .unwrap();
+            let head = git.head().unwrap();
+            git.notes_add("adr", &head, note).unwrap();
+            expected.push((head.clone(), git.notes_show("adr", &head).unwrap().unwrap()));
+        }
+
+        let mut notes = git.notes_show_all("adr").unwrap();
+        notes.sort();
+        expected.sort();
+        assert_eq!(notes, expected);
     }
 
     #[test]
-    fn test_config_get_nonexistent() {
+    fn test_cat_file_batch_missing_object() {
         let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
@@ -401,6 +965,24 @@ mod tests {
             .output()
             .unwrap();
         let git = Git::with_work_dir(temp_dir.path());
+        git.config_set("user.email", "test@example.com").unwrap();
+        git.config_set("user.name", "Test").unwrap();
+        git.run_silent(&["commit", "--allow-empty", "-m", "Initial"])
+            .unwrap();
+
+        let contents = git
+            .cat_file_batch(&["HEAD", "refs/heads/missing", "HEAD^{tree}"])
+            .unwrap();
+        assert_eq!(contents.len(), 3);
+        assert!(String::from_utf8_lossy(contents[0].as_ref().unwrap()).contains("Initial"));
+        assert!(contents[1].is_none());
+        // The empty tree has no content
+        assert_eq!(contents[2].as_deref(), Some(&[][..]));
+    }
+
+    #[test]
+    fn test_config_get_nonexistent() {
+        let git = Git::with_work_dir(read_only_repo());
         let result = git.config_get("nonexistent.key");
         assert!(result.is_ok());
         assert!(result.unwrap().is_none());
@@ -421,7 +1003,7 @@ mod tests {
     }
 
     #[test]
-    fn test_config_unset() {
+    fn test_config_get_case_insensitive_names() {
         let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
@@ -429,14 +1011,30 @@ mod tests {
             .output()
             .unwrap();
         let git = Git::with_work_dir(temp_dir.path());
-        git.config_set("test.key", "value").unwrap();
-        git.config_unset("test.key", false).unwrap();
-        let result = git.config_get("test.key").unwrap();
-        assert!(result.is_none());
+        git.config_set("Test.CamelKey", "value").unwrap();
+        git.config_set("test.Sub.Key", "nested").unwrap();
+
+        assert_eq!(
+            git.config_get("test.camelkey").unwrap().as_deref(),
+            Some("value")
+        );
+        assert_eq!(
+            git.config_get("TEST.CAMELKEY").unwrap().as_deref(),
+            Some("value")
+        );
+        assert_eq!(
+            git.config_get("test.Sub.key").unwrap().as_deref(),
+            Some("nested")
+        );
+        // Subsection names are case-sensitive
+        assert_eq!(git.config_get("test.sub.key").unwrap(), None);
+
+        let entries = git.config_entries("test.").unwrap();
+        assert_eq!(entries.len(), 2);
     }
 
     #[test]
-    fn test_config_unset_nonexistent() {
+    fn test_config_cache_shared_by_clones() {
         let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
@@ -444,50 +1042,78 @@ mod tests {
             .output()
             .unwrap();
         let git = Git::with_work_dir(temp_dir.path());
-        // Unsetting a key that doesn't exist should not error (exit code 5)
-        let result = git.config_unset("nonexistent.key", false);
-        assert!(result.is_ok());
+        let clone = git.clone();
+        assert_eq!(git.config_get("test.key").unwrap(), None);
+
+        clone.config_set("test.key", "value").unwrap();
+        assert_eq!(
+            git.config_get("test.key").unwrap().as_deref(),
+            Some("value")
+        );
     }
 
     #[test]
-    fn test_notes_show_nonexistent() {
+    fn test_config_cache_sees_external_changes() {
         let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
             .args(["init"])
             .output()
             .unwrap();
-        // Create initial commit
-        std::fs::write(temp_dir.path().join("file.txt"), "content").unwrap();
-        Command::new("git")
-            .current_dir(temp_dir.path())
-            .args(["add", "."])
-            .output()
-            .unwrap();
+        let git = Git::with_work_dir(temp_dir.path());
+        assert_eq!(git.config_get("test.key").unwrap(), None);
+
         Command::new("git")
             .current_dir(temp_dir.path())
-            .args(["config", "user.email", "test@example.com"])
+            .args(["config", "test.key", "  padded  "])
             .output()
             .unwrap();
+        assert_eq!(
+            git.config_get("test.key").unwrap().as_deref(),
+            Some("padded")
+        );
+        assert_eq!(
+            git.config_entries("test.").unwrap(),
+            vec![("test.key".to_string(), "padded".to_string())]
+        );
+    }
+
+    #[test]
+    fn test_config_cache_sees_new_include() {
+        let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
-            .args(["config", "user.name", "Test"])
+            .args(["init"])
             .output()
             .unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
-            .args(["commit", "-m", "Initial"])
+            .args(["config", "include.path", "extra.config"])
             .output()
             .unwrap();
-
         let git = Git::with_work_dir(temp_dir.path());
-        let result = git.notes_show("adr", "HEAD");
-        assert!(result.is_ok());
-        assert!(result.unwrap().is_none());
+        assert_eq!(git.config_get("test.key").unwrap(), None);
+
+        // The included file didn't exist when the cache was filled
+        std::fs::write(
+            temp_dir.path().join(".git").join("extra.config"),
+            "[test]\n\tkey = included\n",
+        )
+        .unwrap();
+        assert_eq!(
+            git.config_get("test.key").unwrap().as_deref(),
+            Some("included")
+        );
     }
 
     #[test]
-    fn test_repo_root() {
+    fn test_git_is_send_and_sync() {
+        fn assert_send_sync<T: Send + Sync>() {}
+        assert_send_sync::<Git>();
+    }
+
+    #[test]
+    fn test_config_get_regexp() {
         let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
@@ -495,41 +1121,83 @@ mod tests {
             .output()
             .unwrap();
         let git = Git::with_work_dir(temp_dir.path());
-        let root = git.repo_root();
-        assert!(root.is_ok());
+        assert!(git.config_get_regexp(r"^test\.", true).unwrap().is_empty());
+
+        git.config_set("test.first", "one").unwrap();
+        git.config_set("test.second", "two words").unwrap();
+        git.config_set("other.key", "ignored").unwrap();
+
+        let entries = git.config_get_regexp(r"^test\.", true).unwrap();
+        assert_eq!(
+            entries,
+            vec![
+                ("test.first".to_string(), "one".to_string()),
+                ("test.second".to_string(), "two words".to_string()),
+            ]
+        );
     }
 
     #[test]
-    fn test_head_and_short_hash() {
+    fn test_config_unset() {
         let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
             .args(["init"])
             .output()
             .unwrap();
-        std::fs::write(temp_dir.path().join("file.txt"), "content").unwrap();
-        Command::new("git")
-            .current_dir(temp_dir.path())
-            .args(["add", "."])
-            .output()
-            .unwrap();
-        Command::new("git")
-            .current_dir(temp_dir.path())
-            .args(["config", "user.email", "test@example.com"])
-            .output()
-            .unwrap();
-        Command::new("git")
-            .current_dir(temp_dir.path())
-            .args(["config", "user.name", "Test"])
-            .output()
-            .unwrap();
+        let git = Git::with_work_dir(temp_dir.path());
+        git.config_set("test.key", "value").unwrap();
+        git.config_unset("test.key", false).unwrap();
+        let result = git.config_get("test.key").unwrap();
+        assert!(result.is_none());
+    }
+
+    #[test]
+    fn test_config_unset_nonexistent() {
+        let temp_dir = TempDir::new().unwrap();
         Command::new("git")
             .current_dir(temp_dir.path())
-            .args(["commit", "-m", "Initial"])
+            .args(["init"])
             .output()
             .unwrap();
+        let git = Git::with_work_dir(temp_dir.path());
+        // Unsetting a key that doesn't exist should not error (exit code 5)
+        let result = git.config_unset("nonexistent.key", false);
+        assert!(result.is_ok());
+    }
 
+    #[test]
+    fn test_notes_add_round_trips_content() {
+        let temp_dir = TempDir::new().unwrap();
+        init_repo_with_commit(temp_dir.path());
         let git = Git::with_work_dir(temp_dir.path());
+        git.config_set("user.email", "test@example.com").unwrap();
+        git.config_set("user.name", "Test").unwrap();
+
+        // Content starting with dashes is data on stdin, never an option
+        let content = "---\nid: ADR-0001\n---\n\n## Context\n\nLarge body.\n";
+        git.notes_add("adr", "HEAD", content).unwrap();
+        assert_eq!(git.notes_show("adr", "HEAD").unwrap().unwrap(), content);
+    }
+
+    #[test]
+    fn test_notes_show_nonexistent() {
+        let git = Git::with_work_dir(read_only_repo());
+        let result = git.notes_show("adr", "HEAD");
+        assert!(result.is_ok());
+        assert!(result.unwrap().is_none());
+    }
+
+    #[test]
+    fn test_repo_root() {
+        let git = Git::with_work_dir(read_only_repo());
+        let root = git.repo_root();
+        assert!(root.is_ok());
+    }
+
+    #[test]
+    fn test_head_and_short_hash() {
+        let git = Git::with_work_dir(read_only_repo());
         let head = git.head().unwrap();
         assert_eq!(head.len(), 40); // Full SHA
 
@@ -3,6 +3,8 @@
 //! This module provides the `NotesManager` which handles CRUD operations
 //! for ADRs stored in git notes.
 
+use std::cell::RefCell;
+
 use crate::core::{Adr, AdrConfig, Git};
 use crate::Error;
 
@@ -16,13 +18,19 @@ pub const ARTIFACTS_NOTES_REF: &str = "adr-artifacts";
 pub struct NotesManager {
     git: Git,
     config: AdrConfig,
+    /// ADRs read by the last `list`, dropped whenever a note is written.
+    cache: RefCell<Option<Vec<Adr>>>,
 }
 
 impl NotesManager {
     /// Create a new `NotesManager`.
     #[must_use]
     pub const fn new(git: Git, config: AdrConfig) -> Self {
-        Self { git, config }
+        Self {
+            git,
+            config,
+            cache: RefCell::new(None),
+        }
     }
 
     /// Get a reference to the Git wrapper.
@@ -39,22 +47,39 @@ impl NotesManager {
 
     /// List all ADRs.
     ///
+    /// All notes are read in one batch and the parsed ADRs are cached
+    /// until this manager writes a note.
+    ///
     /// # Errors
     ///
     /// Returns an error if ADRs cannot be listed.
     pub fn list(&self) -> Result<Vec<Adr>, Error> {
-        let notes = self.git.notes_list(ADR_NOTES_REF)?;
+        self.with_adrs(<[Adr]>::to_vec)
+    }
+
+    /// Run `f` over the cached ADRs, reading them first if needed.
+    ///
+    /// Lookups go through here so they can inspect the cache in place
+    /// instead of cloning every ADR the way `list` must.
+    fn with_adrs<R>(&self, f: impl FnOnce(&[Adr]) -> R) -> Result<R, Error> {
+        if let Some(adrs) = self.cache.borrow().as_ref() {
+            return Ok(f(adrs));
+        }
+
+        let adrs = self.read_all()?;
+        let result = f(&adrs);
+        *self.cache.borrow_mut() = Some(adrs);
+        Ok(result)
+    }
+
+    /// Read and parse every ADR note, bypassing the cache.
+    fn read_all(&self) -> Result<Vec<Adr>, Error> {
         let mut adrs = Vec::new();
 
-        for (note_hash, commit) in notes {
-            if let Some(content) = self.git.notes_show(ADR_NOTES_REF, &commit)? {
-                // Extract ADR ID from the content or generate from commit
-                let id = self.extract_id(&content, &commit)?;
-                if let Ok(adr) = Adr::from_markdown(id, commit.clone(), &content) {
-                    adrs.push(adr);
-                }
+        for (commit, content) in self.git.notes_show_all(ADR_NOTES_REF)? {
+            if let Ok(adr) = self.parse_note(commit, &content) {
+                adrs.push(adr);
             }
-            let _ = note_hash; // Used for future artifact lookup
         }
 
         // Sort by ID
@@ -63,18 +88,40 @@ impl NotesManager {
         Ok(adrs)
     }
 
+    /// Parse the note attached to `commit` as an ADR.
+    ///
+    /// The frontmatter is parsed once; the ADR ID is taken from its `id`
+    /// field, or generated from the commit's short hash if it has none.
+    fn parse_note(&self, commit: String, content: &str) -> Result<Adr, Error> {
+        let mut adr = Adr::from_markdown(String::new(), commit, content)?;
+        adr.id = if let Some(id) = &adr.frontmatter.id {
+            id.clone()
+        } else {
+            let short = self.git.short_hash(&adr.commit)?;
+            format!("{}{}", self.config.prefix, short)
+        };
+        Ok(adr)
+    }
+
     /// Get an ADR by ID.
     ///
     /// # Errors
     ///
     /// Returns an error if the ADR is not found or cannot be read.
     pub fn get(&self, id: &str) -> Result<Adr, Error> {
-        let adrs = self.list()?;
-        adrs.into_iter()
-            .find(|adr| adr.id == id)
+        self.with_adrs(|adrs| adrs.iter().find(|adr| adr.id == id).cloned())?
             .ok_or_else(|| Error::AdrNotFound { id: id.to_string() })
     }
 
+    /// Check whether an ADR with the given ID exists.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if ADRs cannot be listed.
+    pub fn exists(&self, id: &str) -> Result<bool, Error> {
+        self.with_adrs(|adrs| adrs.iter().any(|adr| adr.id == id))
+    }
+
     /// Get an ADR by commit hash.
     ///
     /// # Errors
@@ -88,8 +135,7 @@ impl NotesManager {
                     id: commit.to_string(),
                 })?;
 
-        let id = self.extract_id(&content, commit)?;
-        Adr::from_markdown(id, commit.to_string(), &content)
+        self.parse_note(commit.to_string(), &content)
     }
 
     /// Create a new ADR.
@@ -105,6 +151,7 @@ impl NotesManager {
         };
 
         let content = adr.to_markdown()?;
+        self.cache.borrow_mut().take();
         self.git.notes_add(ADR_NOTES_REF, &commit, &content)?;
 
         Ok(())
@@ -117,9 +164,12 @@ impl NotesManager {
     /// Returns an error if the ADR cannot be updated.
     pub fn update(&self, adr: &Adr) -> Result<(), Error> {
         // Verify ADR exists
-        let _ = self.get(&adr.id)?;
+        if !self.exists(&adr.id)? {
+            return Err(Error::AdrNotFound { id: adr.id.clone() });
+        }
 
         let content = adr.to_markdown()?;
+        self.cache.borrow_mut().take();
         self.git.notes_add(ADR_NOTES_REF, &adr.commit, &content)?;
 
         Ok(())
@@ -132,6 +182,7 @@ impl NotesManager {
     /// Returns an error if the ADR cannot be deleted.
     pub fn delete(&self, id: &str) -> Result<(), Error> {
         let adr = self.get(id)?;
+        self.cache.borrow_mut().take();
         self.git.notes_remove(ADR_NOTES_REF, &adr.commit)?;
         Ok(())
     }
@@ -142,16 +193,16 @@ impl NotesManager {
     ///
     /// Returns an error if ADRs cannot be listed.
     pub fn next_number(&self) -> Result<u32, Error> {
-        let adrs = self.list()?;
-        let max_num = adrs
-            .iter()
-            .filter_map(|adr| {
-                adr.id
-                    .strip_prefix(&self.config.prefix)
-                    .and_then(|s| s.parse::<u32>().ok())
-            })
-            .max()
-            .unwrap_or(0);
+        let max_num = self.with_adrs(|adrs| {
+            adrs.iter()
+                .filter_map(|adr| {
+                    adr.id
+                        .strip_prefix(&self.config.prefix)
+                        .and_then(|s| s.parse::<u32>().ok())
+                })
+                .max()
+                .unwrap_or(0)
+        })?;
 
         Ok(max_num + 1)
     }
@@ -167,40 +218,6 @@ impl NotesManager {
         )
     }
 
-    /// Extract ADR ID from content or generate from commit.
-    fn extract_id(&self, content: &str, commit: &str) -> Result<String, Error> {
-        // Try to parse frontmatter and get ID field
-        if let Some(id) = Self::extract_id_from_frontmatter(content) {
-            return Ok(id);
-        }
-
-        // Fall back to generating from commit short hash
-        let short = self.git.short_hash(commit)?;
-        Ok(format!("{}{}", self.config.prefix, short))
-    }
-
-    /// Extract ID from YAML frontmatter if present.
-    fn extract_id_from_frontmatter(content: &str) -> Option<String> {
-        /// Helper struct for extracting just the ID from frontmatter.
-        #[derive(serde::Deserialize)]
-        struct FrontmatterId {
-            id: Option<String>,
-        }
-
-        let content = content.trim();
-        if !content.starts_with("---") {
-            return None;
-        }
-
-        let rest = &content[3..];
-        let end_marker = rest.find("\n---")?;
-        let yaml_content = &rest[..end_marker];
-
-        serde_yaml::from_str::<FrontmatterId>(yaml_content)
-            .ok()
-            .and_then(|fm| fm.id)
-    }
-
     /// Sync notes with remote.
     ///
     /// # Errors
@@ -208,6 +225,7 @@ impl NotesManager {
     /// Returns an error if sync fails.
     pub fn sync(&self, remote: &str, push: bool, fetch: bool) -> Result<(), Error> {
         if fetch {
+            self.cache.borrow_mut().take();
             // Fetch notes (ignore errors if ref doesn't exist on remote)
             let _ = self.git.notes_fetch(remote, ADR_NOTES_REF);
             let _ = self.git.notes_fetch(remote, ARTIFACTS_NOTES_REF);
@@ -228,8 +246,13 @@ mod tests {
     use super::*;
     use crate::core::AdrConfig;
     use std::process::Command as StdCommand;
+    use std::sync::LazyLock;
     use tempfile::TempDir;
 
+    /// ADR shared by tests that only borrow it; built once rather than per test.
+    static SAMPLE_ADR: LazyLock<Adr> =
+        LazyLock::new(|| Adr::new("ADR-0001".to_string(), "Test Decision".to_string()));
+
     fn setup_git_repo() -> TempDir {
         let temp_dir = TempDir::new().expect("Failed to create temp directory");
         let path = temp_dir.path();
@@ -293,7 +316,8 @@ mod tests {
     }
 
     #[test]
-    fn test_extract_id_from_frontmatter_with_id() {
+    fn test_parse_note_with_id() {
+        let manager = NotesManager::new(Git::new(), AdrConfig::default());
         let content = r#"---
 id: ADR-0001
 title: Test
@@ -302,12 +326,21 @@ status: proposed
 
 Body content
 "#;
-        let result = NotesManager::extract_id_from_frontmatter(content);
-        assert_eq!(result, Some("ADR-0001".to_string()));
+        let adr = manager
+            .parse_note("abc123".to_string(), content)
+            .expect("Should parse");
+        assert_eq!(adr.id, "ADR-0001");
+        assert_eq!(adr.commit, "abc123");
+        assert_eq!(adr.body, "Body content");
     }
 
     #[test]
-    fn test_extract_id_from_frontmatter_without_id() {
+    fn test_parse_note_without_id() {
+        let temp_dir = setup_git_repo();
+        let git = Git::with_work_dir(temp_dir.path());
+        let head = git.head().expect("Should resolve HEAD");
+        let short = git.short_hash(&head).expect("Should shorten");
+        let manager = NotesManager::new(git, AdrConfig::default());
         let content = r#"---
 title: Test
 status: proposed
@@ -315,25 +348,44 @@ status: proposed
 
 Body content
 "#;
-        let result = NotesManager::extract_id_from_frontmatter(content);
-        assert_eq!(result, None);
+        let adr = manager.parse_note(head, content).expect("Should parse");
+        assert_eq!(adr.id, format!("ADR-{short}"));
     }
 
     #[test]
-    fn test_extract_id_from_frontmatter_no_frontmatter() {
+    fn test_parse_note_no_frontmatter() {
+        let manager = NotesManager::new(Git::new(), AdrConfig::default());
         let content = "Just some plain text without frontmatter";
-        let result = NotesManager::extract_id_from_frontmatter(content);
-        assert_eq!(result, None);
+        assert!(manager.parse_note("abc123".to_string(), content).is_err());
     }
 
     #[test]
-    fn test_extract_id_from_frontmatter_invalid_yaml() {
+    fn test_parse_note_invalid_yaml() {
+        let manager = NotesManager::new(Git::new(), AdrConfig::default());
         let content = r#"---
 invalid: yaml: content:
 ---
 "#;
-        let result = NotesManager::extract_id_from_frontmatter(content);
-        assert_eq!(result, None);
+        assert!(manager.parse_note("abc123".to_string(), content).is_err());
+    }
+
+    #[test]
+    fn test_exists() {
+        let temp_dir = setup_git_repo();
+        let git = Git::with_work_dir(temp_dir.path());
+        let manager = NotesManager::new(git, AdrConfig::default());
+
+        assert!(!manager.exists("ADR-0001").expect("Should check"));
+        let adr = Adr::new("ADR-0001".to_string(), "To delete".to_string());
+        manager.create(&adr).expect("Should create ADR");
+        assert!(manager.exists("ADR-0001").expect("Should check"));
+
+        manager.delete("ADR-0001").expect("Should delete ADR");
+        assert!(!manager.exists("ADR-0001").expect("Should check"));
+        assert!(matches!(
+            manager.update(&adr),
+            Err(Error::AdrNotFound { .. })
+        ));
     }
 
     #[test]
@@ -378,6 +430,21 @@ invalid: yaml: content:
         assert_eq!(adrs[0].id, "ADR-0001");
     }
 
+    #[test]
+    fn test_list_cache_invalidated_by_create() {
+        let temp_dir = setup_git_repo();
+        let git = Git::with_work_dir(temp_dir.path());
+        let manager = NotesManager::new(git, AdrConfig::default());
+
+        assert!(manager.list().expect("Should list ADRs").is_empty());
+
+        manager.create(&SAMPLE_ADR).expect("Should create ADR");
+
+        let adrs = manager.list().expect("Should list ADRs");
+        assert_eq!(adrs.len(), 1);
+        assert_eq!(adrs[0].frontmatter.title, "Test Decision");
+    }
+
     #[test]
     fn test_get_by_commit() {
         let temp_dir = setup_git_repo();
@@ -389,8 +456,7 @@ invalid: yaml: content:
         let head = git.head().expect("Should get HEAD");
 
         // Create ADR on this commit
-        let adr = Adr::new("ADR-0001".to_string(), "Test Decision".to_string());
-        manager.create(&adr).expect("Should create ADR");
+        manager.create(&SAMPLE_ADR).expect("Should create ADR");
 
         // Get by commit
         let retrieved = manager.get_by_commit(&head);
@@ -4,6 +4,7 @@
 //! with built-in templates for common ADR formats.
 
 use crate::Error;
+use std::cell::RefCell;
 use std::collections::HashMap;
 use tera::{Context, Tera};
 
@@ -218,10 +219,22 @@ Description of alternative approach
 {% endfor %}
 "#;
 
+/// Built-in templates as `(name, source)` pairs.
+const BUILTIN_TEMPLATES: &[(&str, &str)] = &[
+    ("nygard", TEMPLATE_NYGARD),
+    ("madr", TEMPLATE_MADR),
+    ("y-statement", TEMPLATE_Y_STATEMENT),
+    ("alexandrian", TEMPLATE_ALEXANDRIAN),
+    ("business-case", TEMPLATE_BUSINESS_CASE),
+];
+
 /// Template engine for ADR generation.
+///
+/// Built-in templates are compiled on first use, so commands that render a
+/// single format don't pay for parsing every other one.
 #[derive(Debug)]
 pub struct TemplateEngine {
-    tera: Tera,
+    tera: RefCell<Tera>,
 }
 
 impl Default for TemplateEngine {
@@ -234,25 +247,43 @@ impl TemplateEngine {
     /// Create a new template engine with built-in templates.
     #[must_use]
     pub fn new() -> Self {
-        let mut tera = Tera::default();
+        Self {
+            tera: RefCell::new(Tera::default()),
+        }
+    }
 
-        // Add built-in templates
-        let _ = tera.add_raw_template("nygard", TEMPLATE_NYGARD);
-        let _ = tera.add_raw_template("madr", TEMPLATE_MADR);
-        let _ = tera.add_raw_template("y-statement", TEMPLATE_Y_STATEMENT);
-        let _ = tera.add_raw_template("alexandrian", TEMPLATE_ALEXANDRIAN);
-        let _ = tera.add_raw_template("business-case", TEMPLATE_BUSINESS_CASE);
+    /// Look up the source of a built-in template.
+    fn builtin_source(name: &str) -> Option<&'static str> {
+        BUILTIN_TEMPLATES
+            .iter()
+            .find(|(builtin, _)| *builtin == name)
+            .map(|(_, source)| *source)
+    }
 
-        Self { tera }
+    /// Compile a built-in template if it hasn't been registered yet.
+    fn ensure_compiled(&self, name: &str) {
+        if self.tera.borrow().get_template_names().any(|n| n == name) {
+            return;
+        }
+        if let Some(source) = Self::builtin_source(name) {
+            let _ = self.tera.borrow_mut().add_raw_template(name, source);
+        }
     }
 
     /// Add a custom template.
     ///
+    /// Custom templates may extend or include the built-in ones, so those
+    /// are all compiled first.
+    ///
     /// # Errors
     ///
     /// Returns an error if the template is invalid.
     pub fn add_template(&mut self, name: &str, content: &str) -> Result<(), Error> {
+        for (builtin, _) in BUILTIN_TEMPLATES {
+            self.ensure_compiled(builtin);
+        }
         self.tera
+            .get_mut()
             .add_raw_template(name, content)
             .map_err(|e| Error::TemplateError {
                 message: format!("Failed to add template '{name}': {e}"),
@@ -274,7 +305,9 @@ impl TemplateEngine {
             tera_context.insert(key, value);
         }
 
+        self.ensure_compiled(template);
         self.tera
+            .borrow()
             .render(template, &tera_context)
             .map_err(|e| Error::TemplateError {
                 message: format!("Failed to render template '{template}': {e}"),
@@ -284,13 +317,23 @@ impl TemplateEngine {
     /// List available templates.
     #[must_use]
     pub fn list_templates(&self) -> Vec<String> {
-        self.tera.get_template_names().map(String::from).collect()
+        let mut names: Vec<String> = BUILTIN_TEMPLATES
+            .iter()
+            .map(|(name, _)| (*name).to_string())
+            .collect();
+        for name in self.tera.borrow().get_template_names() {
+            if !names.iter().any(|n| n == name) {
+                names.push(name.to_string());
+            }
+        }
+        names
     }
 
     /// Check if a template exists.
     #[must_use]
     pub fn has_template(&self, name: &str) -> bool {
-        self.tera.get_template_names().any(|n| n == name)
+        Self::builtin_source(name).is_some()
+            || self.tera.borrow().get_template_names().any(|n| n == name)
     }
 
     /// Get template content.
@@ -300,22 +343,18 @@ impl TemplateEngine {
     /// Returns an error if the template doesn't exist.
     pub fn get_template(&self, name: &str) -> Result<String, Error> {
         // Built-in templates
-        match name {
-            "nygard" => Ok(TEMPLATE_NYGARD.to_string()),
-            "madr" => Ok(TEMPLATE_MADR.to_string()),
-            "y-statement" => Ok(TEMPLATE_Y_STATEMENT.to_string()),
-            "alexandrian" => Ok(TEMPLATE_ALEXANDRIAN.to_string()),
-            "business-case" => Ok(TEMPLATE_BUSINESS_CASE.to_string()),
-            _ => Err(Error::TemplateNotFound {
+        Self::builtin_source(name)
+            .map(str::to_string)
+            .ok_or_else(|| Error::TemplateNotFound {
                 name: name.to_string(),
-            }),
-        }
+            })
     }
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
+    use test_case::test_case;
 
     #[test]
     fn test_template_engine_new() {
@@ -331,75 +370,53 @@ mod tests {
         assert!(engine.has_template("nygard"));
     }
 
-    #[test]
-    fn test_render_nygard() {
+    #[test_case("nygard", "Proposed", &["## Status", "Proposed"] ; "nygard")]
+    #[test_case("madr", "accepted", &["Context and Problem Statement"] ; "madr")]
+    #[test_case("y-statement", "proposed", &["In the context of"] ; "y_statement")]
+    #[test_case("alexandrian", "proposed", &["Prologue", "Forces"] ; "alexandrian")]
+    #[test_case(
+        "business-case",
+        "proposed",
+        &["Executive Summary", "Cost-Benefit Analysis"]
+        ; "business_case"
+    )]
+    fn test_render_builtin(name: &str, status: &str, expected: &[&str]) {
         let engine = TemplateEngine::new();
         let mut context = HashMap::new();
         context.insert("title".to_string(), "Test ADR".to_string());
-        context.insert("status".to_string(), "Proposed".to_string());
+        context.insert("status".to_string(), status.to_string());
 
         let result = engine
-            .render("nygard", &context)
+            .render(name, &context)
             .expect("Template should render successfully");
         assert!(result.contains("# Test ADR"));
-        assert!(result.contains("## Status"));
-        assert!(result.contains("Proposed"));
-    }
-
-    #[test]
-    fn test_render_madr() {
-        let engine = TemplateEngine::new();
-        let mut context = HashMap::new();
-        context.insert("title".to_string(), "MADR Test".to_string());
-        context.insert("status".to_string(), "accepted".to_string());
-
-        let result = engine.render("madr", &context).expect("Should render");
-        assert!(result.contains("# MADR Test"));
-        assert!(result.contains("Context and Problem Statement"));
-    }
-
-    #[test]
-    fn test_render_y_statement() {
-        let engine = TemplateEngine::new();
-        let mut context = HashMap::new();
-        context.insert("title".to_string(), "Y Statement Test".to_string());
-        context.insert("status".to_string(), "proposed".to_string());
-
-        let result = engine
-            .render("y-statement", &context)
-            .expect("Should render");
-        assert!(result.contains("# Y Statement Test"));
-        assert!(result.contains("In the context of"));
-    }
-
-    #[test]
-    fn test_render_alexandrian() {
-        let engine = TemplateEngine::new();
-        let mut context = HashMap::new();
-        context.insert("title".to_string(), "Alexandrian Test".to_string());
-        context.insert("status".to_string(), "proposed".to_string());
-
-        let result = engine
-            .render("alexandrian", &context)
-            .expect("Should render");
-        assert!(result.contains("# Alexandrian Test"));
-        assert!(result.contains("Prologue"));
-        assert!(result.contains("Forces"));
+        for needle in expected {
+            assert!(result.contains(needle), "{name} output lacks {needle:?}");
+        }
     }
 
     #[test]
-    fn test_render_business_case() {
+    fn test_render_all_builtin_templates_with_one_engine() {
         let engine = TemplateEngine::new();
         let mut context = HashMap::new();
-        context.insert("title".to_string(), "Business Case Test".to_string());
+        context.insert("title".to_string(), "Shared Engine".to_string());
         context.insert("status".to_string(), "proposed".to_string());
 
-        let result = engine
-            .render("business-case", &context)
-            .expect("Should render");
-        assert!(result.contains("# Business Case Test"));
-        assert!(result.contains("Executive Summary"));
-        assert!(result.contains("Cost-Benefit Analysis"));
+        let expected = [
+            ("nygard", "## Status"),
+            ("madr", "Context and Problem Statement"),
+            ("y-statement", "In the context of"),
+            ("alexandrian", "Forces"),
+            ("business-case", "Executive Summary"),
+        ];
+        // Rendering each format must not disturb the ones compiled before it
+        for _ in 0..2 {
+            for (name, needle) in expected {
+                let result = engine.render(name, &context).expect("Should render");
+                assert!(result.contains("# Shared Engine"), "{name} lost the title");
+                assert!(result.contains(needle), "{name} output lacks {needle:?}");
+            }
+        }
     }
 
     #[test]
@@ -423,6 +440,30 @@ mod tests {
         assert!(engine.has_template("custom"));
     }
 
+    #[test]
+    fn test_custom_template_uses_builtin() {
+        let mut engine = TemplateEngine::new();
+        engine
+            .add_template("extended", "{% extends \"nygard\" %}")
+            .expect("Should add template extending a built-in");
+        engine
+            .add_template("included", "{% include \"madr\" %}\nFooter")
+            .expect("Should add template including a built-in");
+
+        let mut context = HashMap::new();
+        context.insert("title".to_string(), "Custom".to_string());
+        context.insert("status".to_string(), "proposed".to_string());
+
+        let extended = engine.render("extended", &context).expect("Should render");
+        assert!(extended.contains("## Status"), "{extended}");
+        let included = engine.render("included", &context).expect("Should render");
+        assert!(
+            included.contains("Context and Problem Statement"),
+            "{included}"
+        );
+        assert!(included.contains("Footer"), "{included}");
+    }
+
     #[test]
     fn test_get_template() {
         let engine = TemplateEngine::new();
@@ -453,4 +494,20 @@ mod tests {
         let result = engine.add_template("invalid", invalid);
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_builtin_templates_compiled_lazily() {
+        let engine = TemplateEngine::new();
+        let compiled = |name: &str| engine.tera.borrow().get_template_names().any(|n| n == name);
+        assert!(!compiled("nygard"));
+        assert!(engine.has_template("nygard"));
+
+        let mut context = HashMap::new();
+        context.insert("title".to_string(), "Lazy".to_string());
+        context.insert("status".to_string(), "proposed".to_string());
+        engine.render("nygard", &context).expect("Should render");
+
+        assert!(compiled("nygard"));
+        assert!(!compiled("madr"));
+    }
 }
@@ -53,6 +53,9 @@ pub mod wiki;
 #[cfg(feature = "export")]
 pub mod export;
 
+#[cfg(test)]
+mod test_support;
+
 use thiserror::Error;
 
 /// Result type alias for git-adr operations.
@@ -0,0 +1,25 @@
+//! Shared fixtures for the unit tests.
+
+use tempfile::TempDir;
+
+use crate::core::{AdrConfig, ConfigManager, Git};
+
+/// Create a repository with a commit identity, one empty commit and
+/// git-adr initialized with the default configuration.
+pub fn initialized_repo() -> TempDir {
+    let temp_dir = TempDir::new().expect("Failed to create temp directory");
+    let git = Git::with_work_dir(temp_dir.path());
+
+    git.run_silent(&["init"]).expect("Should init git repo");
+    git.config_set("user.email", "test@example.com")
+        .expect("Should set email");
+    git.config_set("user.name", "Test User")
+        .expect("Should set name");
+    git.run_silent(&["commit", "--allow-empty", "-m", "Initial commit"])
+        .expect("Should commit");
+    ConfigManager::new(git)
+        .initialize(&AdrConfig::default())
+        .expect("Should initialize");
+
+    temp_dir
+}
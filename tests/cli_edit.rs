@@ -2,33 +2,33 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::{Template, FIXTURE_GIT_CONFIG};
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
-/// Create a temporary git repository with an ADR.
-fn setup_test_repo_with_adr() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Repository with an ADR, copied by each test.
+static TEMPLATE_REPO: Template = Template::new("adr", build_template_repo);
 
+/// Build the template git repository with an ADR.
+fn build_template_repo(path: &Path) {
     StdCommand::new("git")
         .args(["init"])
         .current_dir(path)
         .output()
         .expect("Failed to init git repo");
 
-    StdCommand::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user email");
-
-    StdCommand::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user name");
+    for &(key, value) in FIXTURE_GIT_CONFIG {
+        StdCommand::new("git")
+            .args(["config", key, value])
+            .current_dir(path)
+            .output()
+            .expect("Failed to configure git repo");
+    }
 
     std::fs::write(path.join("README.md"), "# Test Repo\n").expect("Failed to write README");
     StdCommand::new("git")
@@ -62,8 +62,14 @@ fn setup_test_repo_with_adr() -> TempDir {
         ])
         .assert()
         .success();
+}
 
-    temp_dir
+/// Create a temporary git repository with an ADR.
+///
+/// Copies the shared template instead of re-running `git init`, `commit`,
+/// `adr init` and `adr new` for every test.
+fn setup_test_repo_with_adr() -> TempDir {
+    TEMPLATE_REPO.copy()
 }
 
 #[test]
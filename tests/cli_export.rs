@@ -2,16 +2,23 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::Template;
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
-/// Create a temporary git repository with ADRs.
-fn setup_test_repo_with_adrs() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Repository with ADR initialized but no ADRs.
+static INITIALIZED_TEMPLATE: Template = Template::new("initialized", build_initialized_repo);
+
+/// Repository with two seeded ADRs.
+static SEEDED_TEMPLATE: Template = Template::new("seeded", build_seeded_repo);
 
+/// Build a git repository with an initial commit and ADR initialized.
+fn build_initialized_repo(path: &Path) {
     StdCommand::new("git")
         .args(["init"])
         .current_dir(path)
@@ -48,6 +55,11 @@ fn setup_test_repo_with_adrs() -> TempDir {
         .arg("init")
         .assert()
         .success();
+}
+
+/// Build the template repository with ADRs.
+fn build_seeded_repo(path: &Path) {
+    build_initialized_repo(path);
 
     Command::cargo_bin("git-adr")
         .expect("Failed to find binary")
@@ -75,8 +87,19 @@ fn setup_test_repo_with_adrs() -> TempDir {
         .args(["new", "Second Decision", "--tag", "database"])
         .assert()
         .success();
+}
+
+/// Create a temporary git repository with ADR initialized and no ADRs.
+///
+/// Tests that write their own ADRs start here instead of paying for the
+/// seeded ones.
+fn setup_initialized_repo() -> TempDir {
+    INITIALIZED_TEMPLATE.copy()
+}
 
-    temp_dir
+/// Create a temporary git repository with ADRs.
+fn setup_test_repo_with_adrs() -> TempDir {
+    SEEDED_TEMPLATE.copy()
 }
 
 #[test]
@@ -193,46 +216,9 @@ fn test_export_filter_by_status() {
 
 #[test]
 fn test_export_empty() {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
+    let temp_dir = setup_initialized_repo();
     let path = temp_dir.path();
 
-    StdCommand::new("git")
-        .args(["init"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to init git repo");
-
-    StdCommand::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user email");
-
-    StdCommand::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user name");
-
-    std::fs::write(path.join("README.md"), "# Test Repo\n").expect("Failed to write README");
-    StdCommand::new("git")
-        .args(["add", "."])
-        .current_dir(path)
-        .output()
-        .expect("Failed to stage files");
-    StdCommand::new("git")
-        .args(["commit", "-m", "Initial commit"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to create initial commit");
-
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(path)
-        .arg("init")
-        .assert()
-        .success();
-
     let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
     cmd.current_dir(path)
         .args(["export", "--output", "export"])
@@ -266,46 +252,9 @@ fn test_export_filter_by_tag() {
 
 #[test]
 fn test_export_html_with_code_blocks() {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
+    let temp_dir = setup_initialized_repo();
     let path = temp_dir.path();
 
-    StdCommand::new("git")
-        .args(["init"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to init git repo");
-
-    StdCommand::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user email");
-
-    StdCommand::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user name");
-
-    std::fs::write(path.join("README.md"), "# Test Repo\n").expect("Failed to write README");
-    StdCommand::new("git")
-        .args(["add", "."])
-        .current_dir(path)
-        .output()
-        .expect("Failed to stage files");
-    StdCommand::new("git")
-        .args(["commit", "-m", "Initial commit"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to create initial commit");
-
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(path)
-        .arg("init")
-        .assert()
-        .success();
-
     // Create ADR
     Command::cargo_bin("git-adr")
         .expect("Failed to find binary")
@@ -381,46 +330,9 @@ We decided to use Rust."#;
 
 #[test]
 fn test_export_html_without_tags() {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
+    let temp_dir = setup_initialized_repo();
     let path = temp_dir.path();
 
-    StdCommand::new("git")
-        .args(["init"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to init git repo");
-
-    StdCommand::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user email");
-
-    StdCommand::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user name");
-
-    std::fs::write(path.join("README.md"), "# Test Repo\n").expect("Failed to write README");
-    StdCommand::new("git")
-        .args(["add", "."])
-        .current_dir(path)
-        .output()
-        .expect("Failed to stage files");
-    StdCommand::new("git")
-        .args(["commit", "-m", "Initial commit"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to create initial commit");
-
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(path)
-        .arg("init")
-        .assert()
-        .success();
-
     // Create ADR without any tags
     Command::cargo_bin("git-adr")
         .expect("Failed to find binary")
@@ -452,46 +364,9 @@ fn test_export_html_without_tags() {
 
 #[test]
 fn test_export_html_with_unclosed_code_block() {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
+    let temp_dir = setup_initialized_repo();
     let path = temp_dir.path();
 
-    StdCommand::new("git")
-        .args(["init"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to init git repo");
-
-    StdCommand::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user email");
-
-    StdCommand::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user name");
-
-    std::fs::write(path.join("README.md"), "# Test Repo\n").expect("Failed to write README");
-    StdCommand::new("git")
-        .args(["add", "."])
-        .current_dir(path)
-        .output()
-        .expect("Failed to stage files");
-    StdCommand::new("git")
-        .args(["commit", "-m", "Initial commit"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to create initial commit");
-
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(path)
-        .arg("init")
-        .assert()
-        .success();
-
     // Create ADR
     Command::cargo_bin("git-adr")
         .expect("Failed to find binary")
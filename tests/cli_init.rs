@@ -2,16 +2,20 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::Template;
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
-/// Create an empty git repository.
-fn create_empty_repo() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Empty repository with a git identity, copied by each test.
+static TEMPLATE_REPO: Template = Template::new("empty", build_template_repo);
 
+/// Build the template empty git repository.
+fn build_template_repo(path: &Path) {
     // Initialize git repo
     StdCommand::new("git")
         .args(["init"])
@@ -31,8 +35,14 @@ fn create_empty_repo() -> TempDir {
         .current_dir(path)
         .output()
         .expect("Failed to set git user name");
+}
 
-    temp_dir
+/// Create an empty git repository.
+///
+/// The repository is a copy of a shared template, so no git processes are
+/// spawned per test.
+fn create_empty_repo() -> TempDir {
+    TEMPLATE_REPO.copy()
 }
 
 #[test]
@@ -2,16 +2,21 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::Template;
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
+use test_case::test_case;
 
-/// Create a temporary git repository with ADR notes initialized.
-fn setup_test_repo() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Repository with ADR notes initialized, copied by each test.
+static TEMPLATE_REPO: Template = Template::new("initialized", build_template_repo);
 
+/// Build the template git repository with ADR notes initialized.
+fn build_template_repo(path: &Path) {
     // Initialize git repo
     StdCommand::new("git")
         .args(["init"])
@@ -53,8 +58,14 @@ fn setup_test_repo() -> TempDir {
         .current_dir(path)
         .output()
         .expect("Failed to set adr.initialized");
+}
 
-    temp_dir
+/// Create a temporary git repository with ADR notes initialized.
+///
+/// The repository is a copy of a shared template, so no git processes are
+/// spawned per test.
+fn setup_test_repo() -> TempDir {
+    TEMPLATE_REPO.copy()
 }
 
 /// Add an ADR note to the test repository.
@@ -77,19 +88,9 @@ Test ADR content.
 "#
     );
 
-    // Get HEAD commit
-    let output = StdCommand::new("git")
-        .args(["rev-parse", "HEAD"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to get HEAD");
-    let commit = String::from_utf8_lossy(&output.stdout).trim().to_string();
-
-    // Add note
+    // Attach the note to HEAD; git resolves it, so no rev-parse is needed
     StdCommand::new("git")
-        .args([
-            "notes", "--ref", "adr", "add", "-f", "-m", &content, &commit,
-        ])
+        .args(["notes", "--ref", "adr", "add", "-f", "-m", &content, "HEAD"])
         .current_dir(path)
         .output()
         .expect("Failed to add ADR note");
@@ -180,52 +181,24 @@ fn test_list_filter_by_status() {
         .stdout(predicate::str::contains("1 ADR(s) found"));
 }
 
-#[test]
-fn test_list_json_format() {
-    let temp_dir = setup_test_repo();
-    let path = temp_dir.path();
-
-    add_adr_note(path, "ADR-0001", "Test Decision", "proposed");
-
-    let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(path)
-        .args(["list", "--format", "json"])
-        .assert()
-        .success()
-        .stdout(predicate::str::contains(r#""id": "ADR-0001""#))
-        .stdout(predicate::str::contains(r#""status": "proposed""#));
-}
-
-#[test]
-fn test_list_csv_format() {
+#[test_case("json", &[r#""id": "ADR-0001""#, r#""status": "proposed""#] ; "json")]
+#[test_case("csv", &["id,status,title,date,tags,commit", "ADR-0001"] ; "csv")]
+#[test_case("oneline", &["ADR-0001", "Test Decision"] ; "oneline")]
+fn test_list_format(format: &str, expected: &[&str]) {
     let temp_dir = setup_test_repo();
     let path = temp_dir.path();
 
     add_adr_note(path, "ADR-0001", "Test Decision", "proposed");
 
     let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(path)
-        .args(["list", "--format", "csv"])
-        .assert()
-        .success()
-        .stdout(predicate::str::contains("id,status,title,date,tags,commit"))
-        .stdout(predicate::str::contains("ADR-0001"));
-}
-
-#[test]
-fn test_list_oneline_format() {
-    let temp_dir = setup_test_repo();
-    let path = temp_dir.path();
-
-    add_adr_note(path, "ADR-0001", "Test Decision", "proposed");
-
-    let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(path)
-        .args(["list", "--format", "oneline"])
+    let mut assert = cmd
+        .current_dir(path)
+        .args(["list", "--format", format])
         .assert()
-        .success()
-        .stdout(predicate::str::contains("ADR-0001"))
-        .stdout(predicate::str::contains("Test Decision"));
+        .success();
+    for &needle in expected {
+        assert = assert.stdout(predicate::str::contains(needle));
+    }
 }
 
 #[test]
@@ -2,16 +2,20 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::Template;
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
-/// Create a temporary git repository with ADR initialized.
-fn setup_test_repo() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Repository with ADR initialized, copied by each test.
+static TEMPLATE_REPO: Template = Template::new("initialized", build_template_repo);
 
+/// Build the template git repository with ADR initialized.
+fn build_template_repo(path: &Path) {
     // Initialize git repo
     StdCommand::new("git")
         .args(["init"])
@@ -54,8 +58,14 @@ fn setup_test_repo() -> TempDir {
         .arg("init")
         .assert()
         .success();
+}
 
-    temp_dir
+/// Create a temporary git repository with ADR initialized.
+///
+/// The repository is a copy of a shared template, so neither git nor
+/// `git-adr init` runs per test.
+fn setup_test_repo() -> TempDir {
+    TEMPLATE_REPO.copy()
 }
 
 #[test]
@@ -260,6 +270,37 @@ fn test_new_with_link_to_commit() {
         .stderr(predicate::str::contains("Created ADR"));
 }
 
+#[test]
+fn test_new_from_file_rejects_unknown_template() {
+    let temp_dir = setup_test_repo();
+    let path = temp_dir.path();
+
+    std::fs::write(path.join("adr_body.md"), "## Context\n").expect("Failed to write body file");
+
+    let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
+    cmd.current_dir(path)
+        .args([
+            "new",
+            "File Decision",
+            "--template",
+            "bogus",
+            "--file",
+            "adr_body.md",
+        ])
+        .assert()
+        .failure()
+        .stderr(predicate::str::contains("template not found: bogus"));
+
+    // Nothing was saved
+    let mut list_cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
+    list_cmd
+        .current_dir(path)
+        .arg("list")
+        .assert()
+        .success()
+        .stdout(predicate::str::contains("File Decision").not());
+}
+
 #[test]
 fn test_new_from_file_plain_body() {
     let temp_dir = setup_test_repo();
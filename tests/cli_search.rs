@@ -2,16 +2,20 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::Template;
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
-/// Create a temporary git repository with ADRs.
-fn setup_test_repo_with_adrs() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Repository with ADRs, copied by each test.
+static TEMPLATE_REPO: Template = Template::new("adrs", build_template_repo);
 
+/// Build the template git repository with ADRs.
+fn build_template_repo(path: &Path) {
     StdCommand::new("git")
         .args(["init"])
         .current_dir(path)
@@ -96,8 +100,14 @@ fn setup_test_repo_with_adrs() -> TempDir {
         .args(["new", "Use Kafka for messaging"])
         .assert()
         .success();
+}
 
-    temp_dir
+/// Create a temporary git repository with ADRs.
+///
+/// Copies the shared template instead of re-running `git init`, the
+/// commits, `adr init` and each `adr new` for every test.
+fn setup_test_repo_with_adrs() -> TempDir {
+    TEMPLATE_REPO.copy()
 }
 
 #[test]
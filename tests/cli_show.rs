@@ -6,6 +6,7 @@ use assert_cmd::Command;
 use predicates::prelude::*;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
+use test_case::test_case;
 
 /// Create a temporary git repository with an ADR.
 fn setup_test_repo_with_adr() -> TempDir {
@@ -94,30 +95,24 @@ fn test_show_by_partial_id() {
         .stdout(predicate::str::contains("Use PostgreSQL"));
 }
 
-#[test]
-fn test_show_json_format() {
+#[test_case(
+    "json",
+    &[r#""id": "ADR-0001""#, r#""title": "Use PostgreSQL""#, r#""status": "accepted""#]
+    ; "json"
+)]
+#[test_case("yaml", &["title: Use PostgreSQL"] ; "yaml")]
+fn test_show_format(format: &str, expected: &[&str]) {
     let temp_dir = setup_test_repo_with_adr();
 
     let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(temp_dir.path())
-        .args(["show", "ADR-0001", "--format", "json"])
+    let mut assert = cmd
+        .current_dir(temp_dir.path())
+        .args(["show", "ADR-0001", "--format", format])
         .assert()
-        .success()
-        .stdout(predicate::str::contains(r#""id": "ADR-0001""#))
-        .stdout(predicate::str::contains(r#""title": "Use PostgreSQL""#))
-        .stdout(predicate::str::contains(r#""status": "accepted""#));
-}
-
-#[test]
-fn test_show_yaml_format() {
-    let temp_dir = setup_test_repo_with_adr();
-
-    let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(temp_dir.path())
-        .args(["show", "ADR-0001", "--format", "yaml"])
-        .assert()
-        .success()
-        .stdout(predicate::str::contains("title: Use PostgreSQL"));
+        .success();
+    for &needle in expected {
+        assert = assert.stdout(predicate::str::contains(needle));
+    }
 }
 
 #[test]
@@ -50,73 +50,34 @@ fn setup_test_repo_with_adrs() -> TempDir {
         .success();
 
     // Create several ADRs (each on a separate commit)
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(path)
-        .args([
-            "new",
-            "First Decision",
-            "--status",
-            "accepted",
-            "--tag",
-            "api",
-        ])
-        .assert()
-        .success();
-
-    // Create new commit for second ADR
-    std::fs::write(path.join("file1.txt"), "content1").expect("Failed to write file");
-    StdCommand::new("git")
-        .args(["add", "."])
-        .current_dir(path)
-        .output()
-        .expect("Failed to stage");
-    StdCommand::new("git")
-        .args(["commit", "-m", "Second commit"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to commit");
-
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(path)
-        .args([
-            "new",
-            "Second Decision",
-            "--status",
-            "proposed",
-            "--tag",
-            "database",
-        ])
-        .assert()
-        .success();
-
-    // Create new commit for third ADR
-    std::fs::write(path.join("file2.txt"), "content2").expect("Failed to write file");
-    StdCommand::new("git")
-        .args(["add", "."])
-        .current_dir(path)
-        .output()
-        .expect("Failed to stage");
-    StdCommand::new("git")
-        .args(["commit", "-m", "Third commit"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to commit");
-
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(path)
-        .args([
-            "new",
-            "Third Decision",
-            "--status",
-            "rejected",
-            "--tag",
-            "api",
-        ])
-        .assert()
-        .success();
+    let adrs = [
+        ("First Decision", "accepted", "api"),
+        ("Second Decision", "proposed", "database"),
+        ("Third Decision", "rejected", "api"),
+    ];
+    for (i, (title, status, tag)) in adrs.into_iter().enumerate() {
+        if i > 0 {
+            std::fs::write(path.join(format!("file{i}.txt")), format!("content{i}"))
+                .expect("Failed to write file");
+            StdCommand::new("git")
+                .args(["add", "."])
+                .current_dir(path)
+                .output()
+                .expect("Failed to stage");
+            StdCommand::new("git")
+                .args(["commit", "-m", &format!("Commit for {title}")])
+                .current_dir(path)
+                .output()
+                .expect("Failed to commit");
+        }
+
+        Command::cargo_bin("git-adr")
+            .expect("Failed to find binary")
+            .current_dir(path)
+            .args(["new", title, "--status", status, "--tag", tag])
+            .assert()
+            .success();
+    }
 
     temp_dir
 }
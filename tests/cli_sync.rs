@@ -2,97 +2,118 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::Template;
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
-/// Create a temporary git repository with an ADR and a remote.
-fn setup_test_repo_with_remote() -> (TempDir, TempDir) {
+/// Local repository (with an ADR) and its bare remote, side by side, copied
+/// by each test.
+static TEMPLATE_REPOS: Template = Template::new("repos", build_template_repos);
+
+/// Directory of the local repository inside a copied template.
+const LOCAL: &str = "local";
+
+/// Directory of the bare remote inside a copied template.
+const REMOTE: &str = "remote.git";
+
+/// Build the template local and remote repositories.
+///
+/// The remote is added by relative path so the pair still works after
+/// being copied elsewhere.
+fn build_template_repos(root: &Path) {
     // Create the "remote" bare repository
-    let remote_dir = TempDir::new().expect("Failed to create remote directory");
+    let remote = root.join(REMOTE);
+    std::fs::create_dir(&remote).expect("Failed to create remote directory");
     StdCommand::new("git")
         .args(["init", "--bare"])
-        .current_dir(remote_dir.path())
+        .current_dir(&remote)
         .output()
         .expect("Failed to init bare repo");
 
     // Create the local repository
-    let local_dir = TempDir::new().expect("Failed to create local directory");
-    let path = local_dir.path();
+    let path = root.join(LOCAL);
+    std::fs::create_dir(&path).expect("Failed to create local directory");
 
     StdCommand::new("git")
         .args(["init"])
-        .current_dir(path)
+        .current_dir(&path)
         .output()
         .expect("Failed to init git repo");
 
     StdCommand::new("git")
         .args(["config", "user.email", "test@example.com"])
-        .current_dir(path)
+        .current_dir(&path)
         .output()
         .expect("Failed to set git user email");
 
     StdCommand::new("git")
         .args(["config", "user.name", "Test User"])
-        .current_dir(path)
+        .current_dir(&path)
         .output()
         .expect("Failed to set git user name");
 
-    // Add the remote
-    StdCommand::new("git")
-        .args([
-            "remote",
-            "add",
-            "origin",
-            remote_dir.path().to_str().unwrap(),
-        ])
-        .current_dir(path)
-        .output()
-        .expect("Failed to add remote");
+    // Add the remotes; "upstream" is only used by the custom remote test
+    for name in ["origin", "upstream"] {
+        StdCommand::new("git")
+            .args(["remote", "add", name, &format!("../{REMOTE}")])
+            .current_dir(&path)
+            .output()
+            .expect("Failed to add remote");
+    }
 
     std::fs::write(path.join("README.md"), "# Test Repo\n").expect("Failed to write README");
     StdCommand::new("git")
         .args(["add", "."])
-        .current_dir(path)
+        .current_dir(&path)
         .output()
         .expect("Failed to stage files");
     StdCommand::new("git")
         .args(["commit", "-m", "Initial commit"])
-        .current_dir(path)
+        .current_dir(&path)
         .output()
         .expect("Failed to create initial commit");
 
     // Push to remote
     StdCommand::new("git")
         .args(["push", "-u", "origin", "HEAD:main"])
-        .current_dir(path)
+        .current_dir(&path)
         .output()
         .expect("Failed to push to remote");
 
     Command::cargo_bin("git-adr")
         .expect("Failed to find binary")
-        .current_dir(path)
+        .current_dir(&path)
         .arg("init")
         .assert()
         .success();
 
     Command::cargo_bin("git-adr")
         .expect("Failed to find binary")
-        .current_dir(path)
+        .current_dir(&path)
         .args(["new", "Test ADR"])
         .assert()
         .success();
+}
 
-    (local_dir, remote_dir)
+/// Create a temporary git repository with an ADR and a remote.
+///
+/// Returns the directory holding both; the local repository is under
+/// [`LOCAL`] and the bare remote under [`REMOTE`].
+fn setup_test_repo_with_remote() -> TempDir {
+    TEMPLATE_REPOS.copy()
 }
 
 #[test]
 fn test_sync_push() {
-    let (local_dir, _remote_dir) = setup_test_repo_with_remote();
+    let root_dir = setup_test_repo_with_remote();
 
     let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(local_dir.path())
+    cmd.current_dir(root_dir.path().join(LOCAL))
         .args(["sync", "--push"])
         .assert()
         .success()
@@ -102,10 +123,10 @@ fn test_sync_push() {
 
 #[test]
 fn test_sync_pull() {
-    let (local_dir, _remote_dir) = setup_test_repo_with_remote();
+    let root_dir = setup_test_repo_with_remote();
 
     let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(local_dir.path())
+    cmd.current_dir(root_dir.path().join(LOCAL))
         .args(["sync", "--pull"])
         .assert()
         .success()
@@ -114,11 +135,11 @@ fn test_sync_pull() {
 
 #[test]
 fn test_sync_both() {
-    let (local_dir, _remote_dir) = setup_test_repo_with_remote();
+    let root_dir = setup_test_repo_with_remote();
 
     // Default behavior is both fetch and push
     let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(local_dir.path())
+    cmd.current_dir(root_dir.path().join(LOCAL))
         .arg("sync")
         .assert()
         .success()
@@ -128,22 +149,11 @@ fn test_sync_both() {
 
 #[test]
 fn test_sync_custom_remote() {
-    let (local_dir, remote_dir) = setup_test_repo_with_remote();
-
-    // Add another remote
-    StdCommand::new("git")
-        .args([
-            "remote",
-            "add",
-            "upstream",
-            remote_dir.path().to_str().unwrap(),
-        ])
-        .current_dir(local_dir.path())
-        .output()
-        .expect("Failed to add upstream remote");
+    // The template already has a second remote, "upstream"
+    let root_dir = setup_test_repo_with_remote();
 
     let mut cmd = Command::cargo_bin("git-adr").expect("Failed to find binary");
-    cmd.current_dir(local_dir.path())
+    cmd.current_dir(root_dir.path().join(LOCAL))
         .args(["sync", "upstream", "--push"])
         .assert()
         .success()
@@ -0,0 +1,143 @@
+//! Shared fixtures for the integration tests.
+//!
+//! Each test binary compiles this module separately and uses a different
+//! part of it.
+
+#![allow(dead_code)]
+
+use std::path::{Path, PathBuf};
+use std::process::Command;
+use std::sync::OnceLock;
+use std::time::UNIX_EPOCH;
+use tempfile::TempDir;
+
+/// Repository-local git settings for test fixtures: commit identity, and
+/// no auto-gc, hooks or signing from the developer's global config.
+pub const FIXTURE_GIT_CONFIG: &[(&str, &str)] = &[
+    ("user.email", "test@example.com"),
+    ("user.name", "Test User"),
+    ("gc.auto", "0"),
+    ("core.hooksPath", "/dev/null"),
+    ("commit.gpgsign", "false"),
+];
+
+/// A fixture repository that is built once and copied by each test.
+///
+/// The template is built under `CARGO_TARGET_TMPDIR`, at a path derived
+/// from the test binary and its build time. Later runs of the same build,
+/// and concurrent test processes under nextest, reuse it instead of
+/// building their own. Templates from older builds of the binary are
+/// removed when a new one is created, so nothing piles up between runs.
+pub struct Template {
+    /// Name of the template, unique within a test binary.
+    name: &'static str,
+    /// Populates an empty directory with the template's contents.
+    build: fn(&Path),
+    /// Location of the built template.
+    path: OnceLock<PathBuf>,
+    /// `HEAD` commit of the template repository.
+    head: OnceLock<String>,
+}
+
+impl Template {
+    /// Declare a template; nothing is built until it is first used.
+    pub const fn new(name: &'static str, build: fn(&Path)) -> Self {
+        Self {
+            name,
+            build,
+            path: OnceLock::new(),
+            head: OnceLock::new(),
+        }
+    }
+
+    /// Path to the built template, building it if needed.
+    pub fn path(&self) -> &Path {
+        self.path.get_or_init(|| materialize(self.name, self.build))
+    }
+
+    /// Copy the template into a fresh temporary directory.
+    pub fn copy(&self) -> TempDir {
+        let temp_dir = TempDir::new().expect("Failed to create temp directory");
+        copy_dir(self.path(), temp_dir.path());
+        temp_dir
+    }
+
+    /// `HEAD` of the template repository.
+    ///
+    /// Every copy starts at this commit, so tests that need it before
+    /// moving `HEAD` don't have to run `git rev-parse` themselves.
+    pub fn head(&self) -> &str {
+        self.head.get_or_init(|| {
+            let output = Command::new("git")
+                .args(["rev-parse", "HEAD"])
+                .current_dir(self.path())
+                .output()
+                .expect("Failed to get HEAD");
+            String::from_utf8_lossy(&output.stdout).trim().to_string()
+        })
+    }
+}
+
+/// Build a template at its stable path unless it is already there.
+fn materialize(name: &str, build: fn(&Path)) -> PathBuf {
+    let exe = std::env::current_exe().expect("Failed to locate test binary");
+    let binary = exe
+        .file_stem()
+        .expect("Test binary has no file name")
+        .to_string_lossy();
+    let built = std::fs::metadata(&exe)
+        .and_then(|meta| meta.modified())
+        .expect("Failed to stat test binary")
+        .duration_since(UNIX_EPOCH)
+        .expect("Test binary predates the epoch")
+        .as_nanos();
+
+    let root = Path::new(env!("CARGO_TARGET_TMPDIR")).join("templates");
+    let prefix = format!("{binary}-{name}-");
+    let path = root.join(format!("{prefix}{built}"));
+    if path.exists() {
+        return path;
+    }
+
+    // Build beside the final path and rename it into place, so another
+    // test process never sees a half-built template
+    std::fs::create_dir_all(&root).expect("Failed to create template directory");
+    let staging = TempDir::new_in(&root).expect("Failed to create temp directory");
+    build(staging.path());
+    let staged = staging.keep();
+    if std::fs::rename(&staged, &path).is_err() {
+        // Another process finished the same template first
+        std::fs::remove_dir_all(&staged).expect("Failed to remove staged template");
+        assert!(path.exists(), "Failed to move template into place");
+    }
+
+    for entry in std::fs::read_dir(&root).expect("Failed to read template directory") {
+        let entry = entry.expect("Failed to read directory entry");
+        // Match the whole name: another template's name may extend this one
+        let file_name = entry.file_name();
+        let stale = file_name
+            .to_string_lossy()
+            .strip_prefix(&prefix)
+            .is_some_and(|stamp| !stamp.is_empty() && stamp.bytes().all(|b| b.is_ascii_digit()));
+        if stale && entry.path() != path {
+            // Best effort: a concurrent run may be removing it as well
+            let _ = std::fs::remove_dir_all(entry.path());
+        }
+    }
+
+    path
+}
+
+/// Recursively copy a directory tree.
+fn copy_dir(src: &Path, dst: &Path) {
+    std::fs::create_dir_all(dst).expect("Failed to create directory");
+    for entry in std::fs::read_dir(src).expect("Failed to read directory") {
+        let entry = entry.expect("Failed to read directory entry");
+        let target = dst.join(entry.file_name());
+        if entry.file_type().expect("Failed to stat entry").is_dir() {
+            copy_dir(&entry.path(), &target);
+        } else {
+            std::fs::copy(entry.path(), &target).expect("Failed to copy file");
+        }
+    }
+}
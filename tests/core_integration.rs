@@ -2,15 +2,19 @@
 
 #![allow(deprecated)]
 
+mod common;
+
 use assert_cmd::Command;
+use common::Template;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
-/// Create a temporary git repository.
-fn setup_git_repo() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Empty repository with one commit, copied by each test.
+static TEMPLATE_REPO: Template = Template::new("repo", build_template_repo);
 
+/// Build the template git repository.
+fn build_template_repo(path: &Path) {
     StdCommand::new("git")
         .args(["init"])
         .current_dir(path)
@@ -42,8 +46,14 @@ fn setup_git_repo() -> TempDir {
         .current_dir(path)
         .output()
         .expect("Failed to create initial commit");
+}
 
-    temp_dir
+/// Create a temporary git repository.
+///
+/// Copies the shared template instead of re-running `git init` and the
+/// initial commit for every test.
+fn setup_git_repo() -> TempDir {
+    TEMPLATE_REPO.copy()
 }
 
 #[test]
@@ -396,13 +406,8 @@ fn test_adr_without_id_in_frontmatter() {
         .assert()
         .success();
 
-    // Get HEAD commit hash
-    let output = StdCommand::new("git")
-        .args(["rev-parse", "HEAD"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to get HEAD");
-    let commit = String::from_utf8_lossy(&output.stdout).trim().to_string();
+    // `init` doesn't commit, so HEAD is still the template's
+    let commit = TEMPLATE_REPO.head();
 
     // Manually create ADR note without id field
     let adr_content = r#"---
@@ -416,7 +421,7 @@ This is a manually created ADR without an id field.
 "#;
 
     StdCommand::new("git")
-        .args(["notes", "--ref=adr", "add", "-m", adr_content, &commit])
+        .args(["notes", "--ref=adr", "add", "-m", adr_content, commit])
         .current_dir(path)
         .output()
         .expect("Failed to add note");
@@ -3,10 +3,12 @@
 //! These tests verify the tool works correctly in real-world scenarios,
 //! including edge cases, error handling, and data integrity.
 
-#![allow(deprecated)]
+mod common;
 
 use assert_cmd::Command;
+use common::{Template, FIXTURE_GIT_CONFIG};
 use predicates::prelude::*;
+use std::path::Path;
 use std::process::Command as StdCommand;
 use tempfile::TempDir;
 
@@ -14,28 +16,27 @@ use tempfile::TempDir;
 // TEST UTILITIES
 // =============================================================================
 
-/// Create a basic git repository for testing.
-fn create_git_repo() -> TempDir {
-    let temp_dir = TempDir::new().expect("Failed to create temp directory");
-    let path = temp_dir.path();
+/// Repository with an initial commit.
+static GIT_TEMPLATE: Template = Template::new("git", build_git_template);
+
+/// Repository with an initial commit and ADR initialized.
+static INITIALIZED_TEMPLATE: Template = Template::new("initialized", build_initialized_template);
 
+/// Build the template git repository with an initial commit.
+fn build_git_template(path: &Path) {
     StdCommand::new("git")
         .args(["init"])
         .current_dir(path)
         .output()
         .expect("Failed to init git repo");
 
-    StdCommand::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user email");
-
-    StdCommand::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(path)
-        .output()
-        .expect("Failed to set git user name");
+    for &(key, value) in FIXTURE_GIT_CONFIG {
+        StdCommand::new("git")
+            .args(["config", key, value])
+            .current_dir(path)
+            .output()
+            .expect("Failed to configure git repo");
+    }
 
     std::fs::write(path.join("README.md"), "# Test Repo\n").expect("Failed to write README");
     StdCommand::new("git")
@@ -48,37 +49,49 @@ fn create_git_repo() -> TempDir {
         .current_dir(path)
         .output()
         .expect("Failed to create initial commit");
-
-    temp_dir
 }
 
-/// Create a git repository with ADR initialized.
-fn create_initialized_repo() -> TempDir {
-    let temp_dir = create_git_repo();
+/// Build the template git repository with ADR initialized.
+fn build_initialized_template(path: &Path) {
+    build_git_template(path);
 
-    Command::cargo_bin("git-adr")
-        .expect("Failed to find binary")
-        .current_dir(temp_dir.path())
+    Command::new(env!("CARGO_BIN_EXE_git-adr"))
+        .current_dir(path)
         .arg("init")
         .assert()
         .success();
+}
+
+/// Create a basic git repository for testing.
+///
+/// The repository is a copy of a shared template, so no git processes are
+/// spawned per test.
+fn create_git_repo() -> TempDir {
+    GIT_TEMPLATE.copy()
+}
+
+/// Create a git repository with ADR initialized.
+fn create_initialized_repo() -> TempDir {
+    INITIALIZED_TEMPLATE.copy()
+}
 
-    temp_dir
+/// Build a `git-adr` command rooted at the test repository.
+///
+/// The binary path is fixed at compile time, so no per-call lookup is needed.
+fn git_adr(temp_dir: &TempDir) -> Command {
+    let mut cmd = Command::new(env!("CARGO_BIN_EXE_git-adr"));
+    cmd.current_dir(temp_dir.path());
+    cmd
 }
 
 /// Create an additional commit in the repository.
-fn create_commit(temp_dir: &TempDir, filename: &str, message: &str) {
-    let path = temp_dir.path();
-    std::fs::write(path.join(filename), format!("content for {filename}"))
-        .expect("Failed to write file");
+///
+/// The commit is empty: the tests only need distinct commits to attach ADRs
+/// to, so a single `git commit` replaces writing, staging and committing a file.
+fn create_commit(temp_dir: &TempDir, message: &str) {
     StdCommand::new("git")
-        .args(["add", "."])
-        .current_dir(path)
-        .output()
-        .expect("Failed to stage");
-    StdCommand::new("git")
-        .args(["commit", "-m", message])
-        .current_dir(path)
+        .args(["commit", "--allow-empty", "-m", message])
+        .current_dir(temp_dir.path())
         .output()
         .expect("Failed to commit");
 }
@@ -95,12 +108,7 @@ mod edge_cases {
         let temp_dir = TempDir::new().expect("Failed to create temp directory");
         // Don't initialize git - just a plain directory
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
-            .arg("init")
-            .assert()
-            .failure();
+        git_adr(&temp_dir).arg("init").assert().failure();
         // Error message may be in stdout or stderr depending on implementation
     }
 
@@ -109,9 +117,7 @@ mod edge_cases {
         let temp_dir = create_git_repo();
         // Don't initialize ADR
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Test ADR"])
             .assert()
             .failure()
@@ -122,9 +128,7 @@ mod edge_cases {
     fn test_show_nonexistent_adr() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-9999"])
             .assert()
             .failure()
@@ -135,9 +139,7 @@ mod edge_cases {
     fn test_edit_nonexistent_adr() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-9999", "--status", "accepted"])
             .assert()
             .failure()
@@ -148,9 +150,7 @@ mod edge_cases {
     fn test_rm_nonexistent_adr() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["rm", "ADR-9999", "--force"])
             .assert()
             .failure()
@@ -161,17 +161,13 @@ mod edge_cases {
     fn test_invalid_status() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Test ADR"])
             .assert()
             .success();
 
         // Invalid status should fail
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0001", "--status", "invalid_status"])
             .assert()
             .failure();
@@ -181,9 +177,7 @@ mod edge_cases {
     fn test_list_empty_repo() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("list")
             .assert()
             .success()
@@ -194,9 +188,7 @@ mod edge_cases {
     fn test_search_empty_repo() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["search", "anything"])
             .assert()
             .success()
@@ -207,9 +199,7 @@ mod edge_cases {
     fn test_stats_empty_repo() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("stats")
             .assert()
             .success()
@@ -220,9 +210,7 @@ mod edge_cases {
     fn test_export_empty_repo() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["export", "--output", "export"])
             .assert()
             .success()
@@ -234,9 +222,7 @@ mod edge_cases {
         let temp_dir = create_initialized_repo();
 
         // Try to init again without --force
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("init")
             .assert()
             .success()
@@ -248,9 +234,7 @@ mod edge_cases {
         let temp_dir = create_initialized_repo();
 
         // Init again with --force should succeed
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["init", "--force", "--prefix", "DEC-"])
             .assert()
             .success();
@@ -269,9 +253,7 @@ mod edge_cases {
     fn test_supersede_nonexistent_adr() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["supersede", "ADR-9999", "New Decision"])
             .assert()
             .failure()
@@ -282,9 +264,7 @@ mod edge_cases {
     fn test_link_nonexistent_adr() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["link", "ADR-9999", "ADR-0001", "--type", "relates"])
             .assert()
             .failure();
@@ -294,9 +274,7 @@ mod edge_cases {
     fn test_convert_nonexistent_adr() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["convert", "ADR-9999", "--to", "madr"])
             .assert()
             .failure()
@@ -307,28 +285,16 @@ mod edge_cases {
     fn test_partial_id_matching() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Test ADR"])
             .assert()
             .success();
 
         // Should work with partial ID
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
-            .args(["show", "0001"])
-            .assert()
-            .success();
+        git_adr(&temp_dir).args(["show", "0001"]).assert().success();
 
         // Should work with just number
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
-            .args(["show", "1"])
-            .assert()
-            .success();
+        git_adr(&temp_dir).args(["show", "1"]).assert().success();
     }
 }
 
@@ -344,22 +310,18 @@ mod data_integrity {
         let temp_dir = create_initialized_repo();
 
         // Create an ADR
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Initial Decision"])
             .assert()
             .success();
 
         // Create several more commits
         for i in 1..5 {
-            create_commit(&temp_dir, &format!("file{i}.txt"), &format!("Commit {i}"));
+            create_commit(&temp_dir, &format!("Commit {i}"));
         }
 
         // ADR should still be accessible
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success()
@@ -371,35 +333,27 @@ mod data_integrity {
         let temp_dir = create_initialized_repo();
 
         // Create ADR on initial commit
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "First Decision"])
             .assert()
             .success();
 
         // Create new commit and another ADR
-        create_commit(&temp_dir, "file1.txt", "Second commit");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        create_commit(&temp_dir, "Second commit");
+        git_adr(&temp_dir)
             .args(["new", "Second Decision"])
             .assert()
             .success();
 
         // Create another commit and ADR
-        create_commit(&temp_dir, "file2.txt", "Third commit");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        create_commit(&temp_dir, "Third commit");
+        git_adr(&temp_dir)
             .args(["new", "Third Decision"])
             .assert()
             .success();
 
         // All ADRs should be listed
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("list")
             .assert()
             .success()
@@ -413,9 +367,7 @@ mod data_integrity {
         let temp_dir = create_initialized_repo();
 
         // Create ADR on main branch
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Main Branch Decision"])
             .assert()
             .success();
@@ -427,17 +379,17 @@ mod data_integrity {
             .output()
             .expect("Failed to create branch");
 
-        create_commit(&temp_dir, "feature.txt", "Feature commit");
+        create_commit(&temp_dir, "Feature commit");
 
-        // Go back to main
+        // Go back to the default branch, whatever init.defaultBranch named it
         StdCommand::new("git")
-            .args(["checkout", "main"])
+            .args(["checkout", "-"])
             .current_dir(temp_dir.path())
             .output()
-            .expect("Failed to checkout main");
+            .expect("Failed to checkout default branch");
 
-        // Create another commit on main
-        create_commit(&temp_dir, "main.txt", "Main commit");
+        // Create another commit on the default branch
+        create_commit(&temp_dir, "Main commit");
 
         // Merge feature branch
         StdCommand::new("git")
@@ -447,9 +399,7 @@ mod data_integrity {
             .expect("Failed to merge");
 
         // ADR should still be accessible
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success()
@@ -460,33 +410,25 @@ mod data_integrity {
     fn test_adr_content_preserved_after_edit() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Original Title", "--tag", "original"])
             .assert()
             .success();
 
         // Edit to change status
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0001", "--status", "accepted"])
             .assert()
             .success();
 
         // Add a tag
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0001", "--add-tag", "new-tag"])
             .assert()
             .success();
 
         // Verify all content preserved
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success()
@@ -501,26 +443,20 @@ mod data_integrity {
         let temp_dir = create_initialized_repo();
 
         // Create ADRs
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Database Decision", "--tag", "database"])
             .assert()
             .success();
 
-        create_commit(&temp_dir, "file1.txt", "Commit 1");
+        create_commit(&temp_dir, "Commit 1");
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "API Decision", "--tag", "api"])
             .assert()
             .success();
 
         // Search should find correct ADRs
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["search", "database"])
             .assert()
             .success()
@@ -528,17 +464,13 @@ mod data_integrity {
             .stdout(predicate::str::contains("Database Decision"));
 
         // Edit ADR title
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0001", "--title", "PostgreSQL Decision"])
             .assert()
             .success();
 
         // Search should find updated content
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["search", "PostgreSQL"])
             .assert()
             .success()
@@ -550,41 +482,31 @@ mod data_integrity {
         let temp_dir = create_initialized_repo();
 
         // Create ADR
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "To Be Deleted"])
             .assert()
             .success();
 
         // Verify it exists
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success();
 
         // Delete it
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["rm", "ADR-0001", "--force"])
             .assert()
             .success();
 
         // Verify it's gone
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .failure();
 
         // List should show no ADRs
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("list")
             .assert()
             .success()
@@ -604,17 +526,13 @@ mod end_to_end {
         let temp_dir = create_initialized_repo();
 
         // 1. Create ADR
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Use PostgreSQL", "--tag", "database"])
             .assert()
             .success();
 
         // 2. View it
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success()
@@ -622,25 +540,19 @@ mod end_to_end {
             .stdout(predicate::str::contains("proposed"));
 
         // 3. Edit status to accepted
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0001", "--status", "accepted"])
             .assert()
             .success();
 
         // 4. Add more tags
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0001", "--add-tag", "infrastructure"])
             .assert()
             .success();
 
         // 5. Verify changes
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001", "--metadata-only"])
             .assert()
             .success()
@@ -649,27 +561,21 @@ mod end_to_end {
             .stdout(predicate::str::contains("infrastructure"));
 
         // 6. Create superseding ADR
-        create_commit(&temp_dir, "file1.txt", "New commit");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        create_commit(&temp_dir, "New commit");
+        git_adr(&temp_dir)
             .args(["supersede", "ADR-0001", "Use MySQL Instead"])
             .assert()
             .success();
 
         // 7. Verify original is superseded
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001", "--metadata-only"])
             .assert()
             .success()
             .stdout(predicate::str::contains("superseded"));
 
         // 8. Check stats
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("stats")
             .assert()
             .success()
@@ -681,18 +587,14 @@ mod end_to_end {
     fn test_all_export_formats() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Test ADR", "--tag", "test"])
             .assert()
             .success();
 
         // Markdown export
         let md_dir = temp_dir.path().join("export-md");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args([
                 "export",
                 "--format",
@@ -707,9 +609,7 @@ mod end_to_end {
 
         // JSON export
         let json_dir = temp_dir.path().join("export-json");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args([
                 "export",
                 "--format",
@@ -725,9 +625,7 @@ mod end_to_end {
 
         // HTML export
         let html_dir = temp_dir.path().join("export-html");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args([
                 "export",
                 "--format",
@@ -756,12 +654,10 @@ mod end_to_end {
 
         for (i, format) in formats.iter().enumerate() {
             if i > 0 {
-                create_commit(&temp_dir, &format!("file{i}.txt"), &format!("Commit {i}"));
+                create_commit(&temp_dir, &format!("Commit {i}"));
             }
 
-            Command::cargo_bin("git-adr")
-                .expect("Failed to find binary")
-                .current_dir(temp_dir.path())
+            git_adr(&temp_dir)
                 .args([
                     "new",
                     &format!("Decision using {}", format),
@@ -773,9 +669,7 @@ mod end_to_end {
         }
 
         // Verify all were created
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("list")
             .assert()
             .success()
@@ -787,25 +681,19 @@ mod end_to_end {
         let temp_dir = create_initialized_repo();
 
         // Create with nygard format
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Original ADR", "--template", "nygard"])
             .assert()
             .success();
 
         // Convert to MADR
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["convert", "ADR-0001", "--to", "madr"])
             .assert()
             .success();
 
         // Verify content is preserved
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success()
@@ -817,45 +705,33 @@ mod end_to_end {
         let temp_dir = create_initialized_repo();
 
         // Create ADRs with different statuses and tags
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Proposed ADR", "--tag", "api"])
             .assert()
             .success();
 
-        create_commit(&temp_dir, "file1.txt", "Commit 1");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        create_commit(&temp_dir, "Commit 1");
+        git_adr(&temp_dir)
             .args(["new", "Accepted ADR", "--tag", "database"])
             .assert()
             .success();
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0002", "--status", "accepted"])
             .assert()
             .success();
 
-        create_commit(&temp_dir, "file2.txt", "Commit 2");
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        create_commit(&temp_dir, "Commit 2");
+        git_adr(&temp_dir)
             .args(["new", "Rejected ADR", "--tag", "frontend"])
             .assert()
             .success();
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["edit", "ADR-0003", "--status", "rejected"])
             .assert()
             .success();
 
         // Filter by status
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["list", "--status", "accepted"])
             .assert()
             .success()
@@ -863,9 +739,7 @@ mod end_to_end {
             .stdout(predicate::str::contains("1 ADR(s) found"));
 
         // Filter by tag
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["list", "--tag", "api"])
             .assert()
             .success()
@@ -876,85 +750,58 @@ mod end_to_end {
     fn test_show_output_formats() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Test ADR", "--tag", "test"])
             .assert()
             .success();
 
-        // Markdown format (default)
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
-            .args(["show", "ADR-0001"])
-            .assert()
-            .success()
-            .stdout(predicate::str::contains("---"))
-            .stdout(predicate::str::contains("# Test ADR"));
-
-        // YAML format
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
-            .args(["show", "ADR-0001", "--format", "yaml"])
-            .assert()
-            .success()
-            .stdout(predicate::str::contains("id: ADR-0001"));
-
-        // JSON format
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
-            .args(["show", "ADR-0001", "--format", "json"])
-            .assert()
-            .success()
-            .stdout(predicate::str::contains("\"id\":"));
+        let cases: [(&[&str], &[&str]); 4] = [
+            // Markdown format (default)
+            (&["show", "ADR-0001"], &["---", "# Test ADR"]),
+            (&["show", "ADR-0001", "--format", "yaml"], &["id: ADR-0001"]),
+            (&["show", "ADR-0001", "--format", "json"], &["\"id\":"]),
+            (&["show", "ADR-0001", "--metadata-only"], &["ID: ADR-0001"]),
+        ];
 
-        // Metadata only
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
-            .args(["show", "ADR-0001", "--metadata-only"])
-            .assert()
-            .success()
-            .stdout(predicate::str::contains("ID: ADR-0001"));
+        for (args, expected) in cases {
+            let assert = git_adr(&temp_dir).args(args).assert().success();
+            let stdout = String::from_utf8_lossy(&assert.get_output().stdout);
+            for &needle in expected {
+                assert!(
+                    stdout.contains(needle),
+                    "`git adr {}` output missing {needle:?}:\n{stdout}",
+                    args.join(" ")
+                );
+            }
+        }
     }
 
     #[test]
     fn test_log_command() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "First ADR"])
             .assert()
             .success();
 
-        create_commit(&temp_dir, "file1.txt", "Regular commit");
-        create_commit(&temp_dir, "file2.txt", "Another commit");
+        create_commit(&temp_dir, "Regular commit");
+        create_commit(&temp_dir, "Another commit");
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Second ADR"])
             .assert()
             .success();
 
         // Log should show commits
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("log")
             .assert()
             .success()
             .stderr(predicate::str::contains("commit(s) shown"));
 
         // Log with --linked-only
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["log", "--linked-only"])
             .assert()
             .success()
@@ -966,9 +813,7 @@ mod end_to_end {
         let temp_dir = create_initialized_repo();
 
         // Get config
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["config", "list"])
             .assert()
             .success()
@@ -976,17 +821,13 @@ mod end_to_end {
             .stdout(predicate::str::contains("ADR-"));
 
         // Set config
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["config", "set", "prefix", "DEC-"])
             .assert()
             .success();
 
         // Verify change
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["config", "get", "prefix"])
             .assert()
             .success()
@@ -997,14 +838,12 @@ mod end_to_end {
     fn test_link_command() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "First ADR"])
             .assert()
             .success();
 
-        create_commit(&temp_dir, "file1.txt", "Second commit");
+        create_commit(&temp_dir, "Second commit");
 
         // Get HEAD commit for linking
         let output = StdCommand::new("git")
@@ -1015,9 +854,7 @@ mod end_to_end {
         let commit = String::from_utf8_lossy(&output.stdout).trim().to_string();
 
         // Link ADR to a different commit
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["link", "ADR-0001", &commit])
             .assert()
             .success();
@@ -1027,16 +864,12 @@ mod end_to_end {
     fn test_stats_json_output() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Test ADR", "--tag", "test"])
             .assert()
             .success();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["stats", "--format", "json"])
             .assert()
             .success()
@@ -1059,37 +892,29 @@ mod stress {
         // Create 20 ADRs
         for i in 1..=20 {
             if i > 1 {
-                create_commit(&temp_dir, &format!("file{i}.txt"), &format!("Commit {i}"));
+                create_commit(&temp_dir, &format!("Commit {i}"));
             }
-            Command::cargo_bin("git-adr")
-                .expect("Failed to find binary")
-                .current_dir(temp_dir.path())
+            git_adr(&temp_dir)
                 .args(["new", &format!("Decision {}", i)])
                 .assert()
                 .success();
         }
 
         // List should show all 20
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("list")
             .assert()
             .success()
             .stdout(predicate::str::contains("20 ADR(s) found"));
 
         // Search should work
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["search", "Decision"])
             .assert()
             .success();
 
         // Stats should work
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .arg("stats")
             .assert()
             .success()
@@ -1100,9 +925,7 @@ mod stress {
     fn test_adr_with_many_tags() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args([
                 "new",
                 "Multi-tag ADR",
@@ -1120,9 +943,7 @@ mod stress {
             .assert()
             .success();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success()
@@ -1134,16 +955,12 @@ mod stress {
     fn test_adr_with_special_characters_in_title() {
         let temp_dir = create_initialized_repo();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["new", "Use API v2.0 (with OAuth 2.0)"])
             .assert()
             .success();
 
-        Command::cargo_bin("git-adr")
-            .expect("Failed to find binary")
-            .current_dir(temp_dir.path())
+        git_adr(&temp_dir)
             .args(["show", "ADR-0001"])
             .assert()
             .success()
@@ -1157,31 +974,25 @@ mod stress {
         // Rapid create-edit-show cycles
         for i in 1..=5 {
             if i > 1 {
-                create_commit(&temp_dir, &format!("file{i}.txt"), &format!("Commit {i}"));
+                create_commit(&temp_dir, &format!("Commit {i}"));
             }
 
             let adr_id = format!("ADR-{:04}", i);
 
             // Create
-            Command::cargo_bin("git-adr")
-                .expect("Failed to find binary")
-                .current_dir(temp_dir.path())
+            git_adr(&temp_dir)
                 .args(["new", &format!("Rapid ADR {}", i)])
                 .assert()
                 .success();
 
             // Immediately edit
-            Command::cargo_bin("git-adr")
-                .expect("Failed to find binary")
-                .current_dir(temp_dir.path())
+            git_adr(&temp_dir)
                 .args(["edit", &adr_id, "--status", "accepted"])
                 .assert()
                 .success();
 
             // Immediately show
-            Command::cargo_bin("git-adr")
-                .expect("Failed to find binary")
-                .current_dir(temp_dir.path())
+            git_adr(&temp_dir)
                 .args(["show", &adr_id])
                 .assert()
                 .success()